@@ -1,10 +1,51 @@
 # Updated config/settings.py
 
 import os
-from dotenv import load_dotenv
+import re
+from pathlib import Path
+
+try:
+    from dotenv import load_dotenv
+    DOTENV_AVAILABLE = True
+except ImportError:
+    DOTENV_AVAILABLE = False
+
+# Candidate .env locations, probed once in order: project root, then working directory
+ENV_PATHS = tuple(dict.fromkeys((
+    Path(__file__).resolve().parent.parent / ".env",
+    Path.cwd().resolve() / ".env",
+)))
+
+# KEY=VALUE lines with optional "export" prefix and single/double-quoted values
+_ENV_RE = re.compile(
+    rb"""^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(?:"([^"]*)"|'([^']*)'|([^\r\n#]*))""",
+    re.M,
+)
+
+
+def _parse_env_file(env_path: Path):
+    """Minimal KEY=VALUE parser used when python-dotenv is not installed."""
+    for match in _ENV_RE.finditer(env_path.read_bytes()):
+        key = match.group(1).decode("utf-8")
+        value = (match.group(2) or match.group(3) or match.group(4) or b"").decode("utf-8").strip()
+        # Existing environment variables take precedence, as with load_dotenv()
+        os.environ.setdefault(key, value)
+
+
+def load_environment() -> Path | None:
+    """Load the first .env file found and return its path."""
+    for env_path in ENV_PATHS:
+        if env_path.is_file():
+            if DOTENV_AVAILABLE:
+                load_dotenv(env_path)
+            else:
+                _parse_env_file(env_path)
+            return env_path
+    return None
+
 
 # Load environment variables from a .env file
-load_dotenv()
+ENV_FILE = load_environment()
 
 
 class Config:
@@ -18,6 +59,8 @@ class Config:
         # Spotify API
         self.SPOTIFY_CLIENT_ID = os.getenv("SPOTIFY_CLIENT_ID")
         self.SPOTIFY_CLIENT_SECRET = os.getenv("SPOTIFY_CLIENT_SECRET")
+        # /audio-features is deprecated for new Spotify apps and mostly returns 403
+        self.ENABLE_SPOTIFY_AUDIO_FEATURES = os.getenv("ENABLE_SPOTIFY_AUDIO_FEATURES", "false").lower() in ("1", "true", "yes")
         
         # YouTube API
         self.YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
@@ -44,6 +87,8 @@ class Config:
         self.HOST = os.getenv("HOST", "127.0.0.1")
         self.PORT = int(os.getenv("PORT", 5000))
         self.CACHE_TTL_HOURS = int(os.getenv("CACHE_TTL_HOURS", 24))
+        # Prefetch tokens and open provider connections at startup
+        self.WARMUP_API_CLIENTS = os.getenv("WARMUP_API_CLIENTS", "true").lower() in ("1", "true", "yes")
 
     def validate_required_config(self):
         """
@@ -68,6 +113,7 @@ class Config:
             # Spotify
             "SPOTIFY_CLIENT_ID": self.SPOTIFY_CLIENT_ID,
             "SPOTIFY_CLIENT_SECRET": self.SPOTIFY_CLIENT_SECRET,
+            "ENABLE_SPOTIFY_AUDIO_FEATURES": self.ENABLE_SPOTIFY_AUDIO_FEATURES,
             
             # YouTube
             "YOUTUBE_API_KEY": self.YOUTUBE_API_KEY,
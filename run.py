@@ -6,34 +6,50 @@ Main Application Entry Point with Complete Export Fields
 
 import os
 import sys
+import asyncio
+import atexit
 import logging
 import re
 import json
 import io
+import queue
 import csv
 import time
 import sqlite3
 import base64
+import gzip
+import zlib
+import hashlib
+import tempfile
+import uuid
 from pathlib import Path
-from contextlib import contextmanager
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
-from typing import Any, Optional, Dict, List
+from functools import lru_cache
+from typing import Any, BinaryIO
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-import requests
+import httpx
+import numpy as np
 import uvicorn
-from fastapi import FastAPI, HTTPException, Query, Response, UploadFile, File
-from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Query, Request, Response, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.background import BackgroundTask
+from pydantic import BaseModel, Field, field_validator
 
 # Import your modules
 from config.settings import Config
-from src.services.api_clients import APIClientManager
-from src.services.metadata_collector_async import AsyncMetadataCollector
+from src.services.api_clients import HTTP2_AVAILABLE, APIClientManager, create_http_client, limited_get
+from src.services.metadata_collector_async import BULK_CONCURRENCY, AsyncMetadataCollector
+from src.services.memory_cache import TTLCache
 
 # Excel support
 try:
@@ -43,6 +59,35 @@ except ImportError:
     EXCEL_AVAILABLE = False
     print("⚠️ xlsxwriter not installed. Excel export will be limited.")
 
+# Fast JSON support
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_dumps_bytes(data: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=str, separators=(",", ":")).encode("utf-8")
+
+def json_dumps(data: Any) -> str:
+    """Serialize to a compact JSON string"""
+    return json_dumps_bytes(data).decode("utf-8")
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class FastJSONResponse(JSONResponse):
+    """Default API response, rendered with orjson when available"""
+    
+    def render(self, content: Any) -> bytes:
+        return json_dumps_bytes(content)
+
 # Production configuration
 IS_PRODUCTION = os.getenv("RENDER") is not None or os.getenv("DATABASE_URL") is not None
 
@@ -60,17 +105,122 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # ============= DATABASE MANAGER =============
+def normalize_sources(value: Any) -> list[str]:
+    """Coerce a stored sources value (list, JSON text or empty) to a list of names"""
+    if isinstance(value, list):
+        return value
+    if not value:
+        return []
+    try:
+        parsed = json_loads(value)
+    except (TypeError, ValueError):
+        return []
+    return parsed if isinstance(parsed, list) else []
+
+# Stay under SQLite's default bound-parameter limit for IN (...) lookups
+SQL_MAX_IN_PARAMS = 900
+
+# Columns of the tracks table that callers may project in bulk reads
+TRACK_COLUMNS = frozenset({
+    "isrc", "title", "artist", "album", "duration_ms", "release_date",
+    "spotify_id", "spotify_url", "musicbrainz_recording_id", "youtube_video_id",
+    "youtube_url", "youtube_views", "tempo", "key", "mode", "energy",
+    "danceability", "valence", "popularity", "confidence_score",
+    "data_completeness", "sources", "last_updated", "created_at"
+})
+
+SQL_INSERT_TRACK = """
+    INSERT OR REPLACE INTO tracks (
+        isrc, title, artist, album, duration_ms, release_date,
+        spotify_id, spotify_url, musicbrainz_recording_id, youtube_video_id,
+        youtube_url, youtube_views, tempo, key, mode, energy,
+        danceability, valence, popularity, confidence_score,
+        data_completeness, sources, last_updated
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_INSERT_LYRICS = """
+    INSERT OR REPLACE INTO track_lyrics (
+        isrc, lyrics_text, genius_song_id, genius_url,
+        language_code, explicit_content, copyright_info,
+        source_confidence
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_UPSERT_CACHE_BLOB = "INSERT OR REPLACE INTO cache_blob (isrc, payload, stored_at) VALUES (?, ?, ?)"
+
+SQL_DELETE_CREDITS = "DELETE FROM track_credits WHERE isrc = ?"
+
+SQL_INSERT_CREDIT = """
+    INSERT INTO track_credits (
+        isrc, person_name, credit_type, role_details,
+        source_api, source_confidence
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+SQL_INSERT_HISTORY = """
+    INSERT INTO analysis_history (
+        isrc, analysis_type, status, confidence_score,
+        processing_time_ms, error_message
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Every dashboard figure in one statement: a single scan of tracks plus two scalar subqueries
+SQL_ANALYSIS_STATS = """
+    SELECT
+        COUNT(*) AS total_tracks,
+        AVG(confidence_score) AS avg_confidence,
+        COUNT(spotify_id) AS spotify_coverage,
+        COUNT(youtube_video_id) AS youtube_coverage,
+        COUNT(musicbrainz_recording_id) AS musicbrainz_coverage,
+        (SELECT COUNT(*) FROM track_lyrics) AS tracks_with_lyrics,
+        (SELECT COUNT(DISTINCT isrc) FROM track_credits) AS tracks_with_credits
+    FROM tracks
+"""
+
+# Per-connection tuning. With WAL, NORMAL only syncs at checkpoints, and temp
+# tables, the page cache and mmap reads all stay in memory. Foreign keys stay off
+# because INSERT OR REPLACE on tracks would otherwise fail for rows with lyrics or credits.
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+# Upper bound on idle pooled connections; extra borrowers get a short-lived connection
+SQLITE_POOL_SIZE = int(os.getenv("SQLITE_POOL_SIZE", "8"))
+# Prepared statements kept per connection; the default of 128 is shared by every query shape here
+SQLITE_CACHED_STATEMENTS = 256
+
+# Stats are polled by the UI and health checks; writes invalidate the cached copy early
+STATS_CACHE_SECONDS = 10
+
+# Recently read tracks rows, for repeated lookups from retries and UI polling;
+# every write to tracks drops the affected entries
+TRACK_CACHE_SIZE = 1024
+TRACK_CACHE_SECONDS = 60
+
 class DatabaseManager:
     """SQLite database manager for metadata storage"""
     
     def __init__(self, db_path: str = "data/isrc_metadata.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._stats_cache = TTLCache(maxsize=1, ttl_seconds=STATS_CACHE_SECONDS)
+        self._track_cache = TTLCache(maxsize=TRACK_CACHE_SIZE, ttl_seconds=TRACK_CACHE_SECONDS)
+        # Idle connections kept open so each call skips connect/teardown and reuses a warm page cache
+        self._pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=SQLITE_POOL_SIZE)
+        # Scripts that never run the app lifespan still checkpoint and close cleanly
+        atexit.register(self.close)
         self.create_tables()
     
     def create_tables(self):
         """Initialize all database tables"""
         with self.get_connection() as conn:
+            # WAL is stored in the database file, so switching once covers every later connection
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             
             # Main tracks table with all fields
@@ -149,18 +299,56 @@ class DatabaseManager:
                 )
             """)
             
+            # Serialized analysis results behind MetadataCache, stamped for TTL checks
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS cache_blob (
+                    isrc TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    stored_at INTEGER NOT NULL
+                )
+            """)
+            
+            # Per-ISRC lookups on the child tables; also makes COUNT(DISTINCT isrc) index-only
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_credits_isrc ON track_credits(isrc)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_isrc ON analysis_history(isrc)")
+            
             conn.commit()
             logger.info("📊 Database initialized successfully")
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection that any pool borrower's thread may use"""
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                               cached_statements=SQLITE_CACHED_STATEMENTS)
+        conn.row_factory = sqlite3.Row
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
     @contextmanager
     def get_connection(self):
-        """Get database connection context manager"""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        """Borrow a pooled connection, returning it for reuse afterwards"""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
         try:
             yield conn
         finally:
-            conn.close()
+            # Never hand the next borrower a half-finished transaction
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+    
+    def close(self):
+        """Close every idle pooled connection"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
     
     def get_session(self):
         """Get a database connection (compatibility method)"""
@@ -175,176 +363,288 @@ class DatabaseManager:
         except Exception as e:
             logger.debug(f"Session close error (non-critical): {e}")
     
+    @staticmethod
+    def _track_row(metadata: dict[str, Any], now: str | None = None) -> tuple:
+        """Build the SQL_INSERT_TRACK parameter tuple for metadata"""
+        get = metadata.get
+        
+        # Ensure sources is properly formatted
+        sources = get("sources", [])
+        if isinstance(sources, list):
+            sources_json = json_dumps(sources)
+        else:
+            sources_json = str(sources)
+        
+        return (
+            get("isrc"),
+            get("title"),
+            get("artist"),
+            get("album"),
+            get("duration_ms"),
+            get("release_date"),
+            get("spotify_id"),
+            get("spotify_url"),
+            get("musicbrainz_id") or get("musicbrainz_recording_id"),
+            get("youtube_video_id"),
+            get("youtube_url"),
+            get("youtube_views"),
+            get("tempo"),
+            get("key"),
+            get("mode"),
+            get("energy"),
+            get("danceability"),
+            get("valence"),
+            get("popularity"),
+            get("confidence", get("confidence_score", 0)),
+            get("data_completeness", 0),
+            sources_json,
+            get("last_updated") or now or datetime.now().isoformat()
+        )
+    
+    def _write_track(self, cursor: sqlite3.Cursor, metadata: dict[str, Any]):
+        """Write the tracks row for metadata using an open cursor"""
+        cursor.execute(SQL_INSERT_TRACK, self._track_row(metadata))
+    
+    def _write_tracks(self, cursor: sqlite3.Cursor, records: Iterable[dict[str, Any]]) -> int:
+        """Write many tracks rows with one executemany, skipping records without an ISRC"""
+        now = datetime.now().isoformat()
+        cursor.executemany(
+            SQL_INSERT_TRACK,
+            (self._track_row(record, now) for record in records if record.get("isrc"))
+        )
+        return cursor.rowcount
+    
+    def _write_lyrics(self, cursor: sqlite3.Cursor, isrc: str, lyrics_data: dict[str, Any]):
+        """Write the track_lyrics row using an open cursor"""
+        cursor.execute(SQL_INSERT_LYRICS, (
+            isrc,
+            lyrics_data.get("lyrics_text"),
+            lyrics_data.get("genius_song_id"),
+            lyrics_data.get("genius_url"),
+            lyrics_data.get("language_code"),
+            lyrics_data.get("explicit_content", False),
+            json_dumps(lyrics_data.get("copyright_info", {})),
+            lyrics_data.get("confidence", 0)
+        ))
+    
+    def _write_credits(self, cursor: sqlite3.Cursor, isrc: str, credits_list: list[dict[str, Any]]):
+        """Replace the track_credits rows using an open cursor"""
+        # Clear existing credits
+        cursor.execute(SQL_DELETE_CREDITS, (isrc,))
+        
+        # Insert new credits in one batch
+        cursor.executemany(SQL_INSERT_CREDIT, [
+            (
+                isrc,
+                credit.get("person_name"),
+                credit.get("credit_type"),
+                json_dumps(credit.get("role_details", {})),
+                credit.get("source_api"),
+                credit.get("source_confidence", 0)
+            )
+            for credit in credits_list
+        ])
+    
+    def _write_history(self, cursor: sqlite3.Cursor, isrc: str, history_row: dict[str, Any]):
+        """Write an analysis_history row using an open cursor"""
+        cursor.execute(SQL_INSERT_HISTORY, (
+            isrc,
+            history_row.get("analysis_type"),
+            history_row.get("status"),
+            history_row.get("confidence_score"),
+            history_row.get("processing_time_ms"),
+            history_row.get("error_message")
+        ))
+    
     def save_track_metadata(self, metadata: dict[str, Any]):
         """Save track metadata to database"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Ensure sources is properly formatted
-            sources = metadata.get("sources", [])
-            if isinstance(sources, list):
-                sources_json = json.dumps(sources)
-            else:
-                sources_json = str(sources)
-            
-            # Get current timestamp
-            now = datetime.now().isoformat()
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO tracks (
-                    isrc, title, artist, album, duration_ms, release_date,
-                    spotify_id, spotify_url, musicbrainz_recording_id, youtube_video_id,
-                    youtube_url, youtube_views, tempo, key, mode, energy,
-                    danceability, valence, popularity, confidence_score,
-                    data_completeness, sources, last_updated
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                metadata.get("isrc"),
-                metadata.get("title"),
-                metadata.get("artist"),
-                metadata.get("album"),
-                metadata.get("duration_ms"),
-                metadata.get("release_date"),
-                metadata.get("spotify_id"),
-                metadata.get("spotify_url"),
-                metadata.get("musicbrainz_id"),
-                metadata.get("youtube_video_id"),
-                metadata.get("youtube_url"),
-                metadata.get("youtube_views"),
-                metadata.get("tempo"),
-                metadata.get("key"),
-                metadata.get("mode"),
-                metadata.get("energy"),
-                metadata.get("danceability"),
-                metadata.get("valence"),
-                metadata.get("popularity"),
-                metadata.get("confidence", metadata.get("confidence_score", 0)),
-                metadata.get("data_completeness", 0),
-                sources_json,
-                metadata.get("last_updated", now)
-            ))
-            
+            self._write_track(conn.cursor(), metadata)
             conn.commit()
+            self._track_cache.pop(metadata.get("isrc"))
+            self.invalidate_stats()
             logger.info(f"💾 Saved metadata for {metadata.get('isrc')} to database")
     
+    def save_track_metadata_many(self, records: Iterable[dict[str, Any]]) -> int:
+        """Save many tracks in a single transaction"""
+        with self.get_connection() as conn:
+            with conn:
+                saved = self._write_tracks(conn.cursor(), records)
+        self._track_cache.clear()
+        self.invalidate_stats()
+        logger.info(f"💾 Saved metadata for {saved} tracks to database")
+        return saved
+    
     def save_lyrics(self, isrc: str, lyrics_data: dict[str, Any]):
         """Save lyrics to database"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO track_lyrics (
-                    isrc, lyrics_text, genius_song_id, genius_url,
-                    language_code, explicit_content, copyright_info,
-                    source_confidence
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                isrc,
-                lyrics_data.get("lyrics_text"),
-                lyrics_data.get("genius_song_id"),
-                lyrics_data.get("genius_url"),
-                lyrics_data.get("language_code"),
-                lyrics_data.get("explicit_content", False),
-                json.dumps(lyrics_data.get("copyright_info", {})),
-                lyrics_data.get("confidence", 0)
-            ))
-            
+            self._write_lyrics(conn.cursor(), isrc, lyrics_data)
             conn.commit()
+            self.invalidate_stats()
             logger.info(f"💾 Saved lyrics for {isrc} to database")
     
     def save_credits(self, isrc: str, credits_list: list[dict[str, Any]]):
         """Save credits to database"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Clear existing credits
-            cursor.execute("DELETE FROM track_credits WHERE isrc = ?", (isrc,))
-            
-            # Insert new credits
-            for credit in credits_list:
-                cursor.execute("""
-                    INSERT INTO track_credits (
-                        isrc, person_name, credit_type, role_details,
-                        source_api, source_confidence
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    isrc,
-                    credit.get("person_name"),
-                    credit.get("credit_type"),
-                    json.dumps(credit.get("role_details", {})),
-                    credit.get("source_api"),
-                    credit.get("source_confidence", 0)
-                ))
-            
+            self._write_credits(conn.cursor(), isrc, credits_list)
             conn.commit()
+            self.invalidate_stats()
             logger.info(f"💾 Saved {len(credits_list)} credits for {isrc} to database")
     
+    def save_full(self, isrc: str, metadata: dict[str, Any],
+                  lyrics_data: dict[str, Any] | None = None,
+                  credits: list[dict[str, Any]] | None = None,
+                  history_row: dict[str, Any] | None = None,
+                  cache_entry: tuple[str, bytes, int] | None = None):
+        """Save track, lyrics, credits, history and cache entry for one ISRC in a single transaction"""
+        with self.get_connection() as conn:
+            # Connection context commits once on success and rolls back on error
+            with conn:
+                # Take the write lock up front so a concurrent writer can't force a
+                # deferred read transaction to fail with SQLITE_BUSY on its first write
+                conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.cursor()
+                self._write_track(cursor, metadata)
+                if lyrics_data:
+                    self._write_lyrics(cursor, isrc, lyrics_data)
+                if credits is not None:
+                    self._write_credits(cursor, isrc, credits)
+                if history_row:
+                    self._write_history(cursor, isrc, history_row)
+                if cache_entry:
+                    cursor.execute(SQL_UPSERT_CACHE_BLOB, cache_entry)
+            self._track_cache.pop(metadata.get("isrc"))
+            self.invalidate_stats()
+            logger.info(f"💾 Saved full record for {isrc} to database")
+    
+    def bulk_import(self, records: Iterable[dict[str, Any]]) -> int:
+        """Import many track records in one batch with durability relaxed for the load"""
+        with self.get_connection() as conn:
+            # Journal mode stays WAL; leaving it would need every pooled connection closed
+            previous_sync = conn.execute("PRAGMA synchronous").fetchone()[0]
+            conn.execute("PRAGMA synchronous=OFF")
+            try:
+                with conn:
+                    imported = self._write_tracks(conn.cursor(), records)
+            finally:
+                conn.execute(f"PRAGMA synchronous={previous_sync}")
+        self._track_cache.clear()
+        self.invalidate_stats()
+        logger.info(f"💾 Bulk imported {imported} tracks to database")
+        return imported
+    
+    def is_empty(self) -> bool:
+        """Check whether the tracks table has no rows"""
+        with self.get_connection() as conn:
+            return conn.execute("SELECT 1 FROM tracks LIMIT 1").fetchone() is None
+    
+    @staticmethod
+    def _track_from_row(row: sqlite3.Row) -> dict[str, Any]:
+        """Convert a tracks row to the metadata dict shape used by the app"""
+        track = dict(row)
+        
+        # Parse sources so every record carries a plain list
+        track["sources"] = normalize_sources(track.get("sources"))
+        
+        # Ensure last_updated is a string
+        if track.get("last_updated") and not isinstance(track["last_updated"], str):
+            track["last_updated"] = str(track["last_updated"])
+        
+        return track
+    
     def get_track_by_isrc(self, isrc: str) -> dict[str, Any] | None:
         """Get track metadata from database"""
+        cached = self._track_cache.get(isrc)
+        if cached is not None:
+            return dict(cached)
+        
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM tracks WHERE isrc = ?", (isrc,))
             row = cursor.fetchone()
-            
-            if row:
-                # Convert Row to dict
-                track = dict(row)
-                
-                # Parse sources if it's a JSON string
-                if track.get("sources"):
-                    try:
-                        track["sources"] = json.loads(track["sources"])
-                    except:
-                        track["sources"] = []
-                
-                # Ensure last_updated is a string
-                if track.get("last_updated") and not isinstance(track["last_updated"], str):
-                    track["last_updated"] = str(track["last_updated"])
-                
-                return track
+        if not row:
             return None
+        
+        track = self._track_from_row(row)
+        self._track_cache.set(isrc, track)
+        return dict(track)
+    
+    def get_tracks_by_isrcs(self, isrcs: list[str], columns: Iterable[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Fetch many tracks with IN queries, keyed by ISRC, optionally reading only some columns"""
+        if columns is None:
+            projection = "*"
+            convert = self._track_from_row
+        else:
+            selected = list(dict.fromkeys(("isrc", *columns)))
+            unknown = set(selected) - TRACK_COLUMNS
+            if unknown:
+                raise ValueError(f"Unknown tracks columns: {', '.join(sorted(unknown))}")
+            projection = ", ".join(selected)
+            # sources is only decoded when it was asked for
+            convert = self._track_from_row if "sources" in selected else dict
+        
+        tracks: dict[str, dict[str, Any]] = {}
+        with self.get_connection() as conn:
+            for start in range(0, len(isrcs), SQL_MAX_IN_PARAMS):
+                chunk = isrcs[start:start + SQL_MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                # isrc is the first column of both the table and every projection
+                for row in conn.execute(f"SELECT {projection} FROM tracks WHERE isrc IN ({placeholders})", chunk):
+                    tracks[row[0]] = convert(row)
+        return tracks
+    
+    def get_cache_payloads(self, isrcs: list[str], min_stored_at: int) -> dict[str, tuple[bytes, int]]:
+        """Cached payloads stored at or after min_stored_at, keyed by ISRC"""
+        payloads: dict[str, tuple[bytes, int]] = {}
+        with self.get_connection() as conn:
+            for start in range(0, len(isrcs), SQL_MAX_IN_PARAMS):
+                chunk = isrcs[start:start + SQL_MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT isrc, payload, stored_at FROM cache_blob WHERE isrc IN ({placeholders}) AND stored_at >= ?",
+                    (*chunk, min_stored_at)
+                )
+                for isrc, payload, stored_at in rows:
+                    payloads[isrc] = (payload, stored_at)
+        return payloads
+    
+    def save_cache_payloads(self, entries: list[tuple[str, bytes, int]], tracks: Iterable[dict[str, Any]] = ()):
+        """Store cache payloads, and optionally their tracks rows, in one transaction"""
+        with self.get_connection() as conn:
+            with conn:
+                cursor = conn.cursor()
+                cursor.executemany(SQL_UPSERT_CACHE_BLOB, entries)
+                saved_tracks = self._write_tracks(cursor, tracks)
+        if saved_tracks:
+            self._track_cache.clear()
+            self.invalidate_stats()
     
     def get_analysis_stats(self) -> dict[str, Any]:
         """Get comprehensive analysis statistics"""
+        cached = self._stats_cache.get("stats")
+        if cached is not None:
+            return dict(cached)
+        
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            stats = {}
-            
-            # Total tracks analyzed
-            cursor.execute("SELECT COUNT(*) as count FROM tracks")
-            row = cursor.fetchone()
-            stats["total_tracks"] = row["count"] if row else 0
-            
-            # Average confidence score
-            cursor.execute("SELECT AVG(confidence_score) as avg FROM tracks WHERE confidence_score IS NOT NULL")
-            row = cursor.fetchone()
-            stats["avg_confidence"] = float(row["avg"]) if row and row["avg"] else 0
-            
-            # Tracks with lyrics
-            cursor.execute("SELECT COUNT(*) as count FROM track_lyrics")
-            row = cursor.fetchone()
-            stats["tracks_with_lyrics"] = row["count"] if row else 0
-            
-            # Platform coverage
-            cursor.execute("SELECT COUNT(*) as count FROM tracks WHERE spotify_id IS NOT NULL")
-            row = cursor.fetchone()
-            stats["spotify_coverage"] = row["count"] if row else 0
-            
-            cursor.execute("SELECT COUNT(*) as count FROM tracks WHERE youtube_video_id IS NOT NULL")
-            row = cursor.fetchone()
-            stats["youtube_coverage"] = row["count"] if row else 0
-            
-            cursor.execute("SELECT COUNT(*) as count FROM tracks WHERE musicbrainz_recording_id IS NOT NULL")
-            row = cursor.fetchone()
-            stats["musicbrainz_coverage"] = row["count"] if row else 0
-            
-            # Add credits count
-            cursor.execute("SELECT COUNT(DISTINCT isrc) as count FROM track_credits")
-            row = cursor.fetchone()
-            stats["tracks_with_credits"] = row["count"] if row else 0
-            
-            return stats
+            # Unpacked by position in SQL_ANALYSIS_STATS order, skipping Row's name lookups
+            (total_tracks, avg_confidence, spotify_coverage, youtube_coverage,
+             musicbrainz_coverage, tracks_with_lyrics, tracks_with_credits) = conn.execute(SQL_ANALYSIS_STATS).fetchone()
+        
+        stats = {
+            "total_tracks": total_tracks,
+            "avg_confidence": float(avg_confidence) if avg_confidence else 0,
+            "tracks_with_lyrics": tracks_with_lyrics,
+            "spotify_coverage": spotify_coverage,
+            "youtube_coverage": youtube_coverage,
+            "musicbrainz_coverage": musicbrainz_coverage,
+            "tracks_with_credits": tracks_with_credits
+        }
+        self._stats_cache.set("stats", stats)
+        return dict(stats)
+    
+    def invalidate_stats(self):
+        """Drop the cached stats after a write"""
+        self._stats_cache.pop("stats")
 
     def test_connection(self) -> bool:
         """Test database connection"""
@@ -373,94 +673,179 @@ class TrackLyrics:
     pass
 
 # ============= METADATA CACHE WITH DB FALLBACK =============
+# Hot entries stay in process; everything else is one indexed read from cache_blob
+CACHE_MEMORY_ENTRIES = 4096
+
 class MetadataCache:
     """Enhanced cache with database fallback"""
     
     def __init__(self, db_manager: DatabaseManager, cache_dir: str = "data/cache", ttl_hours: int = 24):
+        # cache_dir is only read to import JSON files left by the old per-ISRC file cache
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl_hours = ttl_hours
+        self.ttl_seconds = ttl_hours * 3600
         self.db = db_manager
-        logger.info(f"📁 Cache initialized at {self.cache_dir}")
+        self._memory = TTLCache(maxsize=CACHE_MEMORY_ENTRIES, ttl_seconds=self.ttl_seconds)
+        logger.info(f"📁 Cache initialized (memory tier: {CACHE_MEMORY_ENTRIES} entries, TTL: {ttl_hours}h)")
+    
+    def _iter_cached_records(self) -> Iterable[dict[str, Any]]:
+        """Yield every readable record in the legacy file cache"""
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                yield json_loads(cache_file.read_bytes())
+            except Exception as e:
+                logger.debug(f"Skipping unreadable cache file {cache_file.name}: {e}")
+    
+    def warm_database(self) -> int:
+        """Populate an empty database from the legacy file cache"""
+        try:
+            if not self.cache_dir.is_dir() or not self.db.is_empty():
+                return 0
+            return self.db.bulk_import(self._iter_cached_records())
+        except Exception as e:
+            logger.error(f"Cache warm-up error: {e}")
+            return 0
+    
+    def _remember(self, isrc: str, data: dict[str, Any], stored_at: float):
+        """Keep an entry in memory for the rest of its TTL"""
+        remaining = stored_at + self.ttl_seconds - time.time()
+        if remaining > 0:
+            self._memory.set(isrc, data, ttl_seconds=remaining)
+    
+    def _read_store(self, isrcs: list[str]) -> dict[str, dict[str, Any]]:
+        """Fresh entries from cache_blob, promoted into the memory tier"""
+        found: dict[str, dict[str, Any]] = {}
+        try:
+            payloads = self.db.get_cache_payloads(isrcs, int(time.time() - self.ttl_seconds))
+        except Exception as e:
+            logger.error(f"Cache read error: {e}")
+            return found
+        for isrc, (payload, stored_at) in payloads.items():
+            try:
+                found[isrc] = json_loads(payload)
+            except Exception as e:
+                logger.error(f"Cache read error for {isrc}: {e}")
+                continue
+            self._remember(isrc, found[isrc], stored_at)
+        return found
     
-    def _get_cache_path(self, isrc: str) -> Path:
-        """Get cache file path for ISRC"""
-        return self.cache_dir / f"{isrc}.json"
+    def _cache_tracks(self, tracks: dict[str, dict[str, Any]]):
+        """Cache rows found in the tracks table without writing them back there"""
+        now = time.time()
+        try:
+            self.db.save_cache_payloads([(isrc, json_dumps_bytes(data), int(now)) for isrc, data in tracks.items()])
+        except Exception as e:
+            logger.error(f"Cache write error: {e}")
+        for isrc, data in tracks.items():
+            self._remember(isrc, data, now)
     
     def get(self, isrc: str) -> dict[str, Any] | None:
         """Get cached data with database fallback"""
-        cache_file = self._get_cache_path(isrc)
+        return self.get_many([isrc]).get(isrc)
+    
+    def get_many(self, isrcs: list[str]) -> dict[str, dict[str, Any]]:
+        """Cached data for many ISRCs: memory first, then one query each for cache_blob and tracks"""
+        found: dict[str, dict[str, Any]] = {}
+        for isrc in isrcs:
+            data = self._memory.get(isrc)
+            if data is not None:
+                found[isrc] = data
+        if len(found) < len(isrcs):
+            found.update(self._read_store([isrc for isrc in isrcs if isrc not in found]))
+        if found:
+            logger.info(f"✅ Cache hits for {len(found)}/{len(isrcs)} ISRCs")
         
-        # Try file cache first
-        if cache_file.exists():
+        # Try database fallback
+        missing = [isrc for isrc in isrcs if isrc not in found]
+        if missing:
             try:
-                age_hours = (time.time() - cache_file.stat().st_mtime) / 3600
-                
-                if age_hours < self.ttl_hours:
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    logger.info(f"✅ Cache hit for {isrc} (age: {age_hours:.1f}h)")
-                    return data
+                db_hits = self.db.get_tracks_by_isrcs(missing)
             except Exception as e:
-                logger.error(f"Cache read error: {e}")
-        
-        # Try database fallback
+                logger.error(f"Database fallback error: {e}")
+                db_hits = {}
+            if db_hits:
+                logger.info(f"📊 Database hits for {len(db_hits)}/{len(missing)} ISRCs")
+                self._cache_tracks(db_hits)
+                found.update(db_hits)
+        
+        return found
+    
+    def set_many(self, items: dict[str, dict[str, Any]]):
+        """Store many records, writing their cache entries and tracks rows in one transaction"""
+        if not items:
+            return
+        now = time.time()
         try:
-            db_data = self.db.get_track_by_isrc(isrc)
-            if db_data:
-                logger.info(f"📊 Database hit for {isrc}")
-                # Update file cache from database
-                self.set(isrc, db_data)
-                return db_data
+            self.db.save_cache_payloads(
+                [(isrc, json_dumps_bytes(data), int(now)) for isrc, data in items.items()],
+                items.values()
+            )
+            logger.info(f"💾 Cached data for {len(items)} ISRCs")
         except Exception as e:
-            logger.error(f"Database fallback error: {e}")
-        
-        return None
+            logger.error(f"Cache write error: {e}")
+        for isrc, data in items.items():
+            self._remember(isrc, data, now)
     
-    def set(self, isrc: str, data: dict[str, Any]):
-        """Store data in cache and database"""
-        cache_file = self._get_cache_path(isrc)
-        
+    def set(self, isrc: str, data: dict[str, Any],
+            lyrics_data: dict[str, Any] | None = None,
+            credits: list[dict[str, Any]] | None = None):
+        """Store data in cache and database, with any lyrics and credits in the same transaction"""
+        now = time.time()
         try:
-            # Save to file cache
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            # Cache entry and tracks row are written together
+            entry = (isrc, json_dumps_bytes(data), int(now))
+            if lyrics_data or credits:
+                self.db.save_full(isrc, data, lyrics_data=lyrics_data, credits=credits, cache_entry=entry)
+            else:
+                self.db.save_cache_payloads([entry], [data])
             logger.info(f"💾 Cached data for {isrc}")
-            
-            # Save to database
-            self.db.save_track_metadata(data)
-            
         except Exception as e:
             logger.error(f"Cache write error: {e}")
+        self._remember(isrc, data, now)
 
 # ============= GENIUS API INTEGRATION =============
-async def get_genius_lyrics(isrc: str, track_title: str | None = None, artist: str | None = None) -> dict[str, Any]:
+# Read once at import, after config.settings has loaded any .env file
+GENIUS_API_KEY = os.getenv("GENIUS_API_KEY")
+GENIUS_ENABLED = bool(GENIUS_API_KEY)
+
+# Caps lyrics lookups in flight; request pacing and 429 back-off come from limited_get
+GENIUS_CONCURRENCY = 32
+_genius_semaphore = asyncio.Semaphore(GENIUS_CONCURRENCY)
+
+async def get_genius_lyrics(isrc: str, track_title: str | None = None, artist: str | None = None,
+                            http_client: httpx.AsyncClient | None = None) -> dict[str, Any]:
     """Get lyrics from Genius API"""
+    if http_client is None:
+        async with create_http_client(timeout=10.0) as client:
+            return await get_genius_lyrics(isrc, track_title, artist, client)
+    
+    async with _genius_semaphore:
+        return await _fetch_genius_lyrics(track_title, artist, http_client)
+
+async def _fetch_genius_lyrics(track_title: str | None, artist: str | None,
+                               http_client: httpx.AsyncClient) -> dict[str, Any]:
+    """Search Genius, then fetch the top hit's credits; the second call needs the first's id"""
     try:
-        api_key = os.getenv("GENIUS_API_KEY")
-        
-        if not api_key:
+        if not GENIUS_ENABLED:
             return {"error": "Genius API not configured"}
         
         if not track_title or not artist:
             return {"error": "Track title and artist required for Genius search"}
         
         # Search for the song
-        headers = {"Authorization": f"Bearer {api_key}"}
+        headers = {"Authorization": f"Bearer {GENIUS_API_KEY}"}
         
         search_params = {"q": f"{artist} {track_title}"}
         
-        search_response = requests.get(
-            "https://api.genius.com/search",
-            headers=headers,
-            params=search_params,
-            timeout=10
+        search_response = await limited_get(
+            http_client, "api.genius.com", "https://api.genius.com/search",
+            headers=headers, params=search_params
         )
         
         if search_response.status_code != 200:
             return {"error": f"Genius search failed: {search_response.status_code}"}
         
-        search_data = search_response.json()
+        search_data = json_loads(search_response.content)
         
         if search_data.get("response", {}).get("hits"):
             # Get the most relevant hit
@@ -469,14 +854,13 @@ async def get_genius_lyrics(isrc: str, track_title: str | None = None, artist: s
             
             # Get song details
             song_id = result.get("id")
-            song_response = requests.get(
-                f"https://api.genius.com/songs/{song_id}",
-                headers=headers,
-                timeout=10
+            # Reuses the search connection (multiplexed when HTTP/2 is available)
+            song_response = await limited_get(
+                http_client, "api.genius.com", f"https://api.genius.com/songs/{song_id}", headers=headers
             )
             
             if song_response.status_code == 200:
-                song_data = song_response.json()["response"]["song"]
+                song_data = json_loads(song_response.content)["response"]["song"]
                 
                 # Extract credits
                 credits = []
@@ -542,11 +926,23 @@ class ISRCAnalysisRequest(BaseModel):
     include_lyrics: bool = Field(default=True, description="Include lyrics from Genius")
     include_credits: bool = Field(default=True, description="Include credits information")
     force_refresh: bool = Field(default=False, description="Skip cache and force refresh")
+    
+    @field_validator("isrc")
+    @classmethod
+    def normalize_isrc(cls, value: str) -> str:
+        """Normalize the ISRC once at parse time"""
+        return clean_isrc(value)
 
 class BulkAnalysisRequest(BaseModel):
     isrcs: list[str] = Field(..., description="List of ISRCs to analyze")
     include_lyrics: bool = Field(default=False, description="Include lyrics (slower)")
     export_format: str = Field(default="csv", description="Export format: csv, excel, json")
+    
+    @field_validator("isrcs")
+    @classmethod
+    def normalize_isrcs(cls, value: list[str]) -> list[str]:
+        """Normalize every ISRC once at parse time"""
+        return [clean_isrc(isrc) for isrc in value]
 
 class ExportRequest(BaseModel):
     isrcs: list[str] = Field(..., description="ISRCs to export")
@@ -554,34 +950,53 @@ class ExportRequest(BaseModel):
     include_confidence: bool = Field(default=True, description="Include confidence metrics")
 
 # ============= ENHANCED CONFIDENCE SCORER =============
+ESSENTIAL_FIELDS = frozenset({"title", "artist", "album", "duration_ms", "release_date"})
+AUDIO_FEATURES = frozenset({"tempo", "key", "energy", "danceability", "valence"})
+EXTERNAL_IDS = frozenset({"spotify_id", "musicbrainz_id", "youtube_video_id"})
+EMPTY_SENTINELS = (None, "", 0, [], {})
+
+# Fixed schema used for data completeness (superset of the scored field groups)
+COMPLETENESS_FIELDS = (
+    "title", "artist", "album", "duration_ms", "release_date",
+    "spotify_id", "spotify_url", "musicbrainz_id", "youtube_video_id", "youtube_url",
+    "youtube_views", "popularity", "tempo", "key", "mode",
+    "energy", "danceability", "valence", "genres", "label"
+)
+COMPLETENESS_SCALE = 100.0 / len(COMPLETENESS_FIELDS)
+ESSENTIAL_SCALE = 100.0 / len(ESSENTIAL_FIELDS)
+AUDIO_SCALE = 100.0 / len(AUDIO_FEATURES)
+EXTERNAL_IDS_SCALE = 100.0 / len(EXTERNAL_IDS)
+
+# Group each completeness field once so scoring does one tuple unpack per field
+# instead of up to three set lookups: 1 = essential, 2 = audio, 3 = external id
+FIELD_GROUPS = tuple(
+    (field, 1 if field in ESSENTIAL_FIELDS else 2 if field in AUDIO_FEATURES else 3 if field in EXTERNAL_IDS else 0)
+    for field in COMPLETENESS_FIELDS
+)
+
 class EnhancedConfidenceScorer:
     """Advanced confidence scoring with multi-factor analysis"""
     
+    WEIGHTS = {
+        "data_sources": 0.25,
+        "essential_fields": 0.20,
+        "audio_features": 0.15,
+        "external_ids": 0.10,
+        "popularity_metrics": 0.10,
+        "lyrics_availability": 0.10,
+        "credits_completeness": 0.05,
+        "cross_validation": 0.05
+    }
+    # Precomputed once: (component, weight) pairs and the damping for 0/1/2 sources
+    WEIGHT_ITEMS = tuple(WEIGHTS.items())
+    SOURCE_MULTIPLIERS = (0.3, 0.7, 0.9)
+    ZERO_SCORES = dict.fromkeys(WEIGHTS, 0.0)
+    WEIGHT_VECTOR = np.fromiter(WEIGHTS.values(), dtype=np.float64)
+    
     @staticmethod
-    def calculate_score(metadata: dict[str, Any], lyrics_data: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Calculate comprehensive confidence score"""
-        
-        scores = {
-            "data_sources": 0.0,
-            "essential_fields": 0.0,
-            "audio_features": 0.0,
-            "external_ids": 0.0,
-            "popularity_metrics": 0.0,
-            "lyrics_availability": 0.0,
-            "credits_completeness": 0.0,
-            "cross_validation": 0.0
-        }
-        
-        weights = {
-            "data_sources": 0.25,
-            "essential_fields": 0.20,
-            "audio_features": 0.15,
-            "external_ids": 0.10,
-            "popularity_metrics": 0.10,
-            "lyrics_availability": 0.10,
-            "credits_completeness": 0.05,
-            "cross_validation": 0.05
-        }
+    def _components(metadata: dict[str, Any], lyrics_data: dict[str, Any] | None = None) -> tuple[dict[str, float], int, int]:
+        """Per-factor scores, non-empty field count and source count for one record"""
+        scores = EnhancedConfidenceScorer.ZERO_SCORES.copy()
         
         # Calculate individual scores
         sources = metadata.get("sources", [])
@@ -594,20 +1009,25 @@ class EnhancedConfidenceScorer:
         if "YouTube" in sources or "Youtube" in sources:
             scores["data_sources"] += 30
         
-        # Essential Fields Score
-        essential = ["title", "artist", "album", "duration_ms", "release_date"]
-        present = sum(1 for field in essential if metadata.get(field))
-        scores["essential_fields"] = (present / len(essential)) * 100
-        
-        # Audio Features Score
-        audio = ["tempo", "key", "energy", "danceability", "valence"]
-        audio_present = sum(1 for field in audio if metadata.get(field) is not None)
-        scores["audio_features"] = (audio_present / len(audio)) * 100
-        
-        # External IDs Score
-        ids = ["spotify_id", "musicbrainz_id", "youtube_video_id"]
-        ids_present = sum(1 for field in ids if metadata.get(field))
-        scores["external_ids"] = (ids_present / len(ids)) * 100
+        # Field presence and completeness in a single pass over the fixed schema
+        present = audio_present = ids_present = non_empty = 0
+        for field, group in FIELD_GROUPS:
+            value = metadata.get(field)
+            if value not in EMPTY_SENTINELS:
+                non_empty += 1
+            if group == 1:
+                if value:
+                    present += 1
+            elif group == 2:
+                if value is not None:
+                    audio_present += 1
+            elif group == 3:
+                if value:
+                    ids_present += 1
+        
+        scores["essential_fields"] = present * ESSENTIAL_SCALE
+        scores["audio_features"] = audio_present * AUDIO_SCALE
+        scores["external_ids"] = ids_present * EXTERNAL_IDS_SCALE
         
         # Popularity Metrics Score
         if metadata.get("popularity"):
@@ -618,16 +1038,9 @@ class EnhancedConfidenceScorer:
         # Lyrics Availability Score
         if metadata.get("has_lyrics") or lyrics_data:
             scores["lyrics_availability"] = 100
-            if lyrics_data and lyrics_data.get("genius_song_id"):
-                scores["lyrics_availability"] = 100
         
         # Credits Completeness Score
-        credits = []
-        if metadata.get("credits"):
-            credits = metadata.get("credits", [])
-        elif lyrics_data and lyrics_data.get("credits"):
-            credits = lyrics_data.get("credits", [])
-        
+        credits = metadata.get("credits") or (lyrics_data.get("credits") if lyrics_data else None)
         if credits:
             scores["credits_completeness"] = min(100, len(credits) * 20)
         
@@ -635,19 +1048,11 @@ class EnhancedConfidenceScorer:
         if len(sources) >= 2:
             scores["cross_validation"] = 100 if len(sources) >= 3 else 70
         
-        # Calculate weighted total
-        total_score = sum(scores[key] * weights[key] for key in scores)
-        
-        # Apply source multiplier
-        if len(sources) == 0:
-            total_score *= 0.3
-        elif len(sources) == 1:
-            total_score *= 0.7
-        elif len(sources) == 2:
-            total_score *= 0.9
-        
-        total_score = min(100, total_score)
-        
+        return scores, non_empty, len(sources)
+    
+    @staticmethod
+    def _result(scores: dict[str, float], total_score: float, non_empty: int) -> dict[str, Any]:
+        """Assemble the score payload from a final (multiplied, capped) total"""
         # Determine quality rating
         if total_score >= 90:
             quality = "Excellent"
@@ -661,223 +1066,371 @@ class EnhancedConfidenceScorer:
             quality = "Insufficient"
         
         # Calculate completeness
-        all_fields = list(metadata.keys())
-        non_empty = sum(1 for field in all_fields 
-                        if metadata.get(field) not in [None, "", 0, [], {}])
-        completeness = (non_empty / len(all_fields)) * 100 if all_fields else 0
+        completeness = non_empty * COMPLETENESS_SCALE
         
         return {
             "confidence_score": round(total_score, 2),
             "data_completeness": round(completeness, 2),
             "quality_rating": quality,
             "score_breakdown": {k: round(v, 2) for k, v in scores.items()},
-            "weights_used": weights
+            "weights_used": EnhancedConfidenceScorer.WEIGHTS
         }
+    
+    @staticmethod
+    def calculate_score(metadata: dict[str, Any], lyrics_data: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Calculate comprehensive confidence score"""
+        scores, non_empty, source_count = EnhancedConfidenceScorer._components(metadata, lyrics_data)
+        
+        # Calculate weighted total
+        total_score = sum(scores[key] * weight for key, weight in EnhancedConfidenceScorer.WEIGHT_ITEMS)
+        
+        # Apply source multiplier
+        if source_count < len(EnhancedConfidenceScorer.SOURCE_MULTIPLIERS):
+            total_score *= EnhancedConfidenceScorer.SOURCE_MULTIPLIERS[source_count]
+        
+        return EnhancedConfidenceScorer._result(scores, min(100, total_score), non_empty)
+    
+    @staticmethod
+    def calculate_scores_bulk(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Score a batch at once: factor matrix times weight vector instead of a per-record weighted sum"""
+        if not items:
+            return []
+        
+        components = [EnhancedConfidenceScorer._components(item) for item in items]
+        matrix = np.array([list(scores.values()) for scores, _, _ in components], dtype=np.float64)
+        source_counts = np.fromiter((count for _, _, count in components), dtype=np.intp, count=len(components))
+        
+        multipliers = EnhancedConfidenceScorer.SOURCE_MULTIPLIERS
+        damping = np.where(
+            source_counts < len(multipliers),
+            np.take(multipliers, np.minimum(source_counts, len(multipliers) - 1)),
+            1.0
+        )
+        totals = np.minimum(matrix @ EnhancedConfidenceScorer.WEIGHT_VECTOR * damping, 100.0)
+        
+        return [
+            EnhancedConfidenceScorer._result(scores, float(total), non_empty)
+            for (scores, non_empty, _), total in zip(components, totals)
+        ]
 
 # ============= EXPORT SERVICE =============
+# Complete list of ALL CSV fields, in column order
+CSV_FIELDNAMES = (
+    # Basic Info
+    "ISRC", "Title", "Artist", "Album", "Duration_MS", "Release_Date",
+    
+    # Platform IDs
+    "Spotify_ID", "Spotify_URL", "MusicBrainz_ID", "YouTube_ID", "YouTube_URL",
+    "Genius_URL", "LastFM_URL", "Discogs_Release_ID", "Discogs_Master_ID", "Discogs_URL",
+    
+    # Metrics
+    "YouTube_Views", "LastFM_Playcount", "LastFM_Listeners", "Spotify_Popularity",
+    
+    # Audio Features  
+    "Tempo", "Key", "Mode", "Time_Signature", "Energy", "Danceability", "Valence",
+    "Loudness", "Speechiness", "Acousticness", "Instrumentalness", "Liveness",
+    
+    # Genre & Tags
+    "Genres", "Styles", "Tags",
+    
+    # Label & Publishing
+    "Label", "Catalog_Number",
+    
+    # Credits (as semicolon-separated lists)
+    "Credits_Names", "Credits_Types", "Credits_Count",
+    
+    # Quality Metrics
+    "Confidence_Score", "Data_Completeness", "Quality_Rating", "Sources",
+    
+    # Timestamps
+    "Last_Updated"
+)
+
+def _join_list(value: Any, separator: str = "; ") -> str:
+    """Join list fields, passing scalar values through as strings"""
+    if isinstance(value, list):
+        return separator.join(value)
+    return str(value) if value else ""
+
+def _csv_row(item: dict[str, Any]) -> list[Any]:
+    """Build one CSV row in CSV_FIELDNAMES order"""
+    get = item.get
+    
+    # Process credits into lists
+    credits = get("credits", ())
+    credit_names = []
+    credit_types = []
+    if credits:
+        for credit in credits:
+            if isinstance(credit, dict):
+                credit_names.append(credit.get("name", credit.get("person_name", "")))
+                credit_types.append(credit.get("credit_type", ""))
+    
+    lyrics_data = get("lyrics_data")
+    
+    return [
+        # Basic Info
+        get("isrc", ""), get("title", ""), get("artist", ""), get("album", ""),
+        get("duration_ms", ""), get("release_date", ""),
+        
+        # Platform IDs
+        get("spotify_id", ""), get("spotify_url", ""),
+        get("musicbrainz_id", get("musicbrainz_recording_id", "")),
+        get("youtube_video_id", ""), get("youtube_url", ""),
+        get("genius_url", lyrics_data.get("genius_url", "") if isinstance(lyrics_data, dict) else ""),
+        get("lastfm_url", ""), get("discogs_release_id", ""), get("discogs_master_id", ""), get("discogs_url", ""),
+        
+        # Metrics
+        get("youtube_views", ""), get("lastfm_playcount", ""), get("lastfm_listeners", ""),
+        get("popularity", get("spotify_popularity", "")),
+        
+        # Audio Features
+        get("tempo", ""), get("key", ""), get("mode", ""), get("time_signature", ""),
+        get("energy", ""), get("danceability", ""), get("valence", ""), get("loudness", ""),
+        get("speechiness", ""), get("acousticness", ""), get("instrumentalness", ""), get("liveness", ""),
+        
+        # Genre & Tags
+        _join_list(get("genres", ())), _join_list(get("styles", ())), _join_list(get("tags", ())),
+        
+        # Label & Publishing
+        get("label", ""), get("catalog_number", ""),
+        
+        # Credits
+        "; ".join(credit_names), "; ".join(credit_types), len(credits),
+        
+        # Quality Metrics
+        get("confidence_score", get("confidence", 0)), get("data_completeness", 0),
+        get("quality_rating", ""), "|".join(get("sources") or ()),
+        
+        # Timestamps
+        get("last_updated", "")
+    ]
+
+# Track Metadata sheet link columns, filled in after write_row, and the
+# confidence column that carries the conditional color formats
+EXCEL_LINK_COLUMNS = (
+    (7, "spotify_url", "Open in Spotify"),
+    (10, "youtube_url", "Watch on YouTube"),
+    (11, "genius_url", "View on Genius"),
+    (12, "lastfm_url", "View on Last.fm"),
+    (15, "discogs_url", "View on Discogs"),
+)
+EXCEL_CONFIDENCE_COLUMN = 37
+
+# PRISM brand cell formats, added to each workbook once
+EXCEL_FORMATS: dict[str, dict[str, Any]] = {
+    'header': {
+        'bold': True,
+        'bg_color': '#1A1A1A',
+        'font_color': '#FFFFFF',
+        'border': 1,
+        'align': 'center',
+        'valign': 'vcenter'
+    },
+    'title': {
+        'bold': True,
+        'font_size': 16,
+        'font_color': '#1A1A1A',
+        'align': 'left'
+    },
+    'subtitle': {
+        'font_size': 12,
+        'font_color': '#666666',
+        'align': 'left'
+    },
+    'high_confidence': {'font_color': '#28a745', 'bold': True},
+    'medium_confidence': {'font_color': '#ffc107', 'bold': True},
+    'low_confidence': {'font_color': '#E50914', 'bold': True},
+}
+# (criteria, value, format name) for the confidence column's color bands
+EXCEL_CONFIDENCE_BANDS = (
+    ('>=', 80, 'high_confidence'),
+    ('>=', 60, 'medium_confidence'),
+    ('<', 60, 'low_confidence'),
+)
+
+def _excel_row(item: dict[str, Any]) -> list[Any]:
+    """Plain cell values for one Track Metadata row; link cells stay empty"""
+    get = item.get
+    return [
+        # Basic Info
+        str(get("isrc", "")), str(get("title", "")), str(get("artist", "")),
+        str(get("album", "")), get("duration_ms", ""), str(get("release_date", "")),
+        
+        # Platform IDs (URL columns are written as hyperlinks)
+        str(get("spotify_id", "")), "",
+        get("musicbrainz_id", get("musicbrainz_recording_id", "")), get("youtube_video_id", ""), "",
+        "", "",
+        str(get("discogs_release_id", "")), str(get("discogs_master_id", "")), "",
+        
+        # Metrics and audio features keep their native types: numbers become
+        # numeric cells, strings stay text and missing values stay blank
+        get("youtube_views", ""), get("lastfm_playcount", ""),
+        get("lastfm_listeners", ""), get("popularity", get("spotify_popularity", "")),
+        
+        # Audio Features
+        get("tempo", ""), get("key", ""), get("mode", ""), get("time_signature", ""),
+        get("energy", ""), get("danceability", ""), get("valence", ""),
+        get("loudness", ""), get("speechiness", ""), get("acousticness", ""),
+        get("instrumentalness", ""), get("liveness", ""),
+        
+        # Genre & Tags
+        _join_list(get("genres", ()), ", "), _join_list(get("styles", ()), ", "), _join_list(get("tags", ()), ", "),
+        
+        # Label & Publishing
+        str(get("label", "")), str(get("catalog_number", "")),
+        
+        # Quality Metrics (confidence is colored by the sheet's conditional formats)
+        get("confidence_score", get("confidence", 0)), get("data_completeness", 0), get("quality_rating", ""),
+        ", ".join(get("sources") or ())
+    ]
+
+# Excel keeps at most this many hyperlinks per worksheet; XlsxWriter drops the rest
+# with a warning, so links past the cap are written as HYPERLINK() formulas instead
+EXCEL_HYPERLINK_LIMIT = 65530
+# Longest link target HYPERLINK() accepts
+EXCEL_FORMULA_URL_MAX = 255
+
+def _excel_hyperlink(url: str, label: str) -> str:
+    """HYPERLINK() formula for a link cell, with quotes escaped for Excel"""
+    return f'=HYPERLINK("{url.replace(chr(34), chr(34) * 2)}","{label}")'
+
+def _excel_links(item: dict[str, Any]) -> Iterator[tuple[int, str, str]]:
+    """(column, url, label) for each hyperlink present on a track"""
+    for col, key, label in EXCEL_LINK_COLUMNS:
+        url = item.get(key, "")
+        if not url and key == "genius_url" and isinstance(item.get("lyrics_data"), dict):
+            url = item["lyrics_data"].get("genius_url", "")
+        if url:
+            yield col, url, label
+
+# In-memory ceiling for workbooks returned by create_excel before they roll over to a temp file
+EXCEL_SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
+# Rows per chunk handed to StreamingResponse; one row per chunk would cost a
+# threadpool hop per row since Starlette iterates sync generators off the loop
+CSV_STREAM_CHUNK_ROWS = 500
+
+# Preamble count label for CSVs whose header is written before the lookups finish
+REQUESTED_ISRCS_LABEL = "Requested ISRCs"
+
+class CSVRowRenderer:
+    """Render tracks to CSV text one at a time, reusing a single buffer and writer"""
+    
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+    
+    def render(self, item: dict[str, Any], include_header: bool = False) -> str:
+        """CSV line for one track, optionally preceded by the column header"""
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        if include_header:
+            self._writer.writerow(CSV_FIELDNAMES)
+        self._writer.writerow(_csv_row(item))
+        return self._buffer.getvalue()
+
 class ExportService:
     """Export service with comprehensive Excel support and ALL fields"""
     
     @staticmethod
-    def create_csv(metadata_list: list[dict[str, Any]]) -> str:
-        """Create CSV export with ALL available fields"""
+    def csv_preamble(count: int, count_label: str = "Total Records") -> str:
+        """Comment lines that open every CSV export
+
+        Streamed exports write this before any lookup finishes, so they label the
+        count as requested ISRCs rather than exported rows.
+        """
+        return (
+            "# PRISM Analytics Engine - Metadata Export\n"
+            f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"# {count_label}: {count}\n"
+            "#\n"
+        )
+    
+    @staticmethod
+    def csv_rows(metadata: Iterable[dict[str, Any]], include_header: bool = False) -> str:
+        """Render tracks as CSV lines, optionally preceded by the column header"""
         output = io.StringIO()
-        
-        # Add metadata header
-        output.write("# PRISM Analytics Engine - Metadata Export\n")
-        output.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        output.write(f"# Total Records: {len(metadata_list)}\n")
-        output.write("#\n")
-        
-        if not metadata_list:
-            return output.getvalue()
-        
-        # Complete list of ALL fields
-        fieldnames = [
-            # Basic Info
-            "ISRC", "Title", "Artist", "Album", "Duration_MS", "Release_Date",
-            
-            # Platform IDs
-            "Spotify_ID", "Spotify_URL", "MusicBrainz_ID", "YouTube_ID", "YouTube_URL",
-            "Genius_URL", "LastFM_URL", "Discogs_Release_ID", "Discogs_Master_ID", "Discogs_URL",
-            
-            # Metrics
-            "YouTube_Views", "LastFM_Playcount", "LastFM_Listeners", "Spotify_Popularity",
-            
-            # Audio Features  
-            "Tempo", "Key", "Mode", "Time_Signature", "Energy", "Danceability", "Valence",
-            "Loudness", "Speechiness", "Acousticness", "Instrumentalness", "Liveness",
-            
-            # Genre & Tags
-            "Genres", "Styles", "Tags",
-            
-            # Label & Publishing
-            "Label", "Catalog_Number",
-            
-            # Credits (as semicolon-separated lists)
-            "Credits_Names", "Credits_Types", "Credits_Count",
-            
-            # Quality Metrics
-            "Confidence_Score", "Data_Completeness", "Quality_Rating", "Sources",
-            
-            # Timestamps
-            "Last_Updated"
-        ]
-        
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for item in metadata_list:
-            # Process credits into lists
-            credits = item.get("credits", [])
-            credit_names = []
-            credit_types = []
-            if credits:
-                for credit in credits:
-                    if isinstance(credit, dict):
-                        credit_names.append(credit.get("name", credit.get("person_name", "")))
-                        credit_types.append(credit.get("credit_type", ""))
-            
-            # Process genres, styles, tags
-            genres = item.get("genres", [])
-            if isinstance(genres, list):
-                genres_str = "; ".join(genres)
-            else:
-                genres_str = str(genres) if genres else ""
-                
-            styles = item.get("styles", [])
-            if isinstance(styles, list):
-                styles_str = "; ".join(styles)
-            else:
-                styles_str = str(styles) if styles else ""
-                
-            tags = item.get("tags", [])
-            if isinstance(tags, list):
-                tags_str = "; ".join(tags)
-            else:
-                tags_str = str(tags) if tags else ""
-            
-            writer.writerow({
-                # Basic Info
-                "ISRC": item.get("isrc", ""),
-                "Title": item.get("title", ""),
-                "Artist": item.get("artist", ""),
-                "Album": item.get("album", ""),
-                "Duration_MS": item.get("duration_ms", ""),
-                "Release_Date": item.get("release_date", ""),
-                
-                # Platform IDs
-                "Spotify_ID": item.get("spotify_id", ""),
-                "Spotify_URL": item.get("spotify_url", ""),
-                "MusicBrainz_ID": item.get("musicbrainz_id", item.get("musicbrainz_recording_id", "")),
-                "YouTube_ID": item.get("youtube_video_id", ""),
-                "YouTube_URL": item.get("youtube_url", ""),
-                "Genius_URL": item.get("genius_url", item.get("lyrics_data", {}).get("genius_url", "") if isinstance(item.get("lyrics_data"), dict) else ""),
-                "LastFM_URL": item.get("lastfm_url", ""),
-                "Discogs_Release_ID": item.get("discogs_release_id", ""),
-                "Discogs_Master_ID": item.get("discogs_master_id", ""),
-                "Discogs_URL": item.get("discogs_url", ""),
-                
-                # Metrics
-                "YouTube_Views": item.get("youtube_views", ""),
-                "LastFM_Playcount": item.get("lastfm_playcount", ""),
-                "LastFM_Listeners": item.get("lastfm_listeners", ""),
-                "Spotify_Popularity": item.get("popularity", item.get("spotify_popularity", "")),
-                
-                # Audio Features
-                "Tempo": item.get("tempo", ""),
-                "Key": item.get("key", ""),
-                "Mode": item.get("mode", ""),
-                "Time_Signature": item.get("time_signature", ""),
-                "Energy": item.get("energy", ""),
-                "Danceability": item.get("danceability", ""),
-                "Valence": item.get("valence", ""),
-                "Loudness": item.get("loudness", ""),
-                "Speechiness": item.get("speechiness", ""),
-                "Acousticness": item.get("acousticness", ""),
-                "Instrumentalness": item.get("instrumentalness", ""),
-                "Liveness": item.get("liveness", ""),
-                
-                # Genre & Tags
-                "Genres": genres_str,
-                "Styles": styles_str,
-                "Tags": tags_str,
-                
-                # Label & Publishing
-                "Label": item.get("label", ""),
-                "Catalog_Number": item.get("catalog_number", ""),
-                
-                # Credits
-                "Credits_Names": "; ".join(credit_names),
-                "Credits_Types": "; ".join(credit_types),
-                "Credits_Count": len(credits),
-                
-                # Quality Metrics
-                "Confidence_Score": item.get("confidence_score", item.get("confidence", 0)),
-                "Data_Completeness": item.get("data_completeness", 0),
-                "Quality_Rating": item.get("quality_rating", ""),
-                "Sources": "|".join(item.get("sources", [])),
-                
-                # Timestamps
-                "Last_Updated": item.get("last_updated", "")
-            })
-        
+        writer = csv.writer(output)
+        if include_header:
+            writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(map(_csv_row, metadata))
         return output.getvalue()
     
     @staticmethod
-    def create_excel(metadata_list: list[dict[str, Any]], db_stats: dict[str, Any] | None = None) -> io.BytesIO:
+    def iter_csv(metadata_list: list[dict[str, Any]], chunk_rows: int = CSV_STREAM_CHUNK_ROWS) -> Iterator[str]:
+        """Yield the CSV export in chunks of rows for streaming responses"""
+        yield ExportService.csv_preamble(len(metadata_list))
+        
+        for start in range(0, len(metadata_list), chunk_rows):
+            yield ExportService.csv_rows(metadata_list[start:start + chunk_rows], include_header=start == 0)
+    
+    @staticmethod
+    def create_csv(metadata_list: list[dict[str, Any]]) -> str:
+        """Create CSV export with ALL available fields"""
+        return "".join(ExportService.iter_csv(metadata_list))
+    
+    @staticmethod
+    def create_excel(metadata_list: list[dict[str, Any]], db_stats: dict[str, Any] | None = None) -> BinaryIO:
         """Create comprehensive Excel export with ALL fields and PRISM branding"""
+        # Small workbooks stay in memory; large ones spill to disk instead of regrowing a buffer
+        output = tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_MAX_BYTES, mode="w+b")
+        try:
+            ExportService.write_excel(output, metadata_list, db_stats)
+        except Exception:
+            output.close()
+            raise
+        output.seek(0)
+        return output
+    
+    @staticmethod
+    def create_excel_file(metadata_list: list[dict[str, Any]], db_stats: dict[str, Any] | None = None) -> str:
+        """Write the Excel export to a temp file and return its path; the caller removes it"""
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as handle:
+            path = handle.name
+        try:
+            ExportService.write_excel(path, metadata_list, db_stats)
+        except Exception:
+            os.unlink(path)
+            raise
+        return path
+    
+    @staticmethod
+    def write_excel(output: str | BinaryIO, metadata_list: list[dict[str, Any]],
+                    db_stats: dict[str, Any] | None = None) -> None:
+        """Write the Excel workbook to a file path or an in-memory buffer"""
         if not EXCEL_AVAILABLE:
             raise ValueError("Excel export not available. Install xlsxwriter.")
         
-        output = io.BytesIO()
-        workbook = xlsxwriter.Workbook(output, {'in_memory': True})
-        
-        # Define PRISM brand colors and formats
-        header_format = workbook.add_format({
-            'bold': True,
-            'bg_color': '#1A1A1A',
-            'font_color': '#FFFFFF',
-            'border': 1,
-            'align': 'center',
-            'valign': 'vcenter'
+        generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # constant_memory flushes each row to a temp file once the next row starts,
+        # so rows must be written top to bottom and merged ranges are not available.
+        # Links are written explicitly with write_url, so plain strings skip URL sniffing,
+        # and track text starting with '=' stays text instead of becoming a formula.
+        workbook = xlsxwriter.Workbook(output, {
+            'constant_memory': True,
+            'in_memory': False,
+            'tmpdir': tempfile.gettempdir(),
+            'strings_to_urls': False,
+            'strings_to_formulas': False
         })
         
-        title_format = workbook.add_format({
-            'bold': True,
-            'font_size': 16,
-            'font_color': '#1A1A1A',
-            'align': 'left'
-        })
+        # PRISM brand formats, registered in EXCEL_FORMATS order
+        formats = {name: workbook.add_format(spec) for name, spec in EXCEL_FORMATS.items()}
+        header_format = formats['header']
+        title_format = formats['title']
+        subtitle_format = formats['subtitle']
         
-        subtitle_format = workbook.add_format({
-            'font_size': 12,
-            'font_color': '#666666',
-            'align': 'left'
-        })
-        
-        high_confidence = workbook.add_format({
-            'font_color': '#28a745',
-            'bold': True
-        })
-        
-        medium_confidence = workbook.add_format({
-            'font_color': '#ffc107',
-            'bold': True
-        })
-        
-        low_confidence = workbook.add_format({
-            'font_color': '#E50914',
-            'bold': True
-        })
+        # Same blue underline write_url applies, for links written as formulas
+        link_format = workbook.get_default_url_format()
         
         # Main metadata sheet
         worksheet = workbook.add_worksheet('Track Metadata')
         
         # Add PRISM branding header
-        worksheet.merge_range(0, 0, 0, 37, 'PRISM Analytics Engine - Complete Metadata Export', title_format)
-        worksheet.merge_range(1, 0, 1, 37, f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}', subtitle_format)
-        worksheet.merge_range(2, 0, 2, 37, f'Total Records: {len(metadata_list)}', subtitle_format)
+        worksheet.write(0, 0, 'PRISM Analytics Engine - Complete Metadata Export', title_format)
+        worksheet.write(1, 0, f'Generated: {generated_at}', subtitle_format)
+        worksheet.write(2, 0, f'Total Records: {len(metadata_list)}', subtitle_format)
         
         # Complete headers for ALL fields
         headers = [
@@ -906,8 +1459,7 @@ class ExportService:
         ]
         
         # Write headers
-        for col, header in enumerate(headers):
-            worksheet.write(4, col, header, header_format)
+        worksheet.write_row(4, 0, headers, header_format)
         
         # Set column widths
         column_widths = [
@@ -923,184 +1475,97 @@ class ExportService:
             if i < len(headers):
                 worksheet.set_column(i, i, width)
         
-        # Write data
-        for row_idx, item in enumerate(metadata_list):
-            row = row_idx + 5
-            col = 0
-            
-            # Basic Info
-            worksheet.write(row, col, str(item.get("isrc", ""))); col += 1
-            worksheet.write(row, col, str(item.get("title", ""))); col += 1
-            worksheet.write(row, col, str(item.get("artist", ""))); col += 1
-            worksheet.write(row, col, str(item.get("album", ""))); col += 1
-            worksheet.write(row, col, str(item.get("duration_ms", ""))); col += 1
-            worksheet.write(row, col, str(item.get("release_date", ""))); col += 1
-            
-            # Platform IDs
-            worksheet.write(row, col, str(item.get("spotify_id", ""))); col += 1
-            
-            # Spotify URL as hyperlink
-            spotify_url = item.get("spotify_url", "")
-            if spotify_url:
-                worksheet.write_url(row, col, spotify_url, string="Open in Spotify")
-            else:
-                worksheet.write(row, col, "")
-            col += 1
-            
-            worksheet.write(row, col, item.get("musicbrainz_id", item.get("musicbrainz_recording_id", ""))); col += 1
-            worksheet.write(row, col, item.get("youtube_video_id", "")); col += 1
-            
-            # YouTube URL as hyperlink
-            youtube_url = item.get("youtube_url", "")
-            if youtube_url:
-                worksheet.write_url(row, col, youtube_url, string="Watch on YouTube")
-            else:
-                worksheet.write(row, col, "")
-            col += 1
-            
-            # Genius URL
-            genius_url = item.get("genius_url", "")
-            if not genius_url and isinstance(item.get("lyrics_data"), dict):
-                genius_url = item["lyrics_data"].get("genius_url", "")
-            if genius_url:
-                worksheet.write_url(row, col, genius_url, string="View on Genius")
-            else:
-                worksheet.write(row, col, "")
-            col += 1
-            
-            # Last.fm URL
-            lastfm_url = item.get("lastfm_url", "")
-            if lastfm_url:
-                worksheet.write_url(row, col, lastfm_url, string="View on Last.fm")
-            else:
-                worksheet.write(row, col, "")
-            col += 1
-            
-            # Discogs IDs and URL
-            worksheet.write(row, col, str(item.get("discogs_release_id", ""))); col += 1
-            worksheet.write(row, col, str(item.get("discogs_master_id", ""))); col += 1
-            
-            discogs_url = item.get("discogs_url", "")
-            if discogs_url:
-                worksheet.write_url(row, col, discogs_url, string="View on Discogs")
-            else:
-                worksheet.write(row, col, "")
-            col += 1
-            
-            # Metrics
-            worksheet.write(row, col, str(item.get("youtube_views", ""))); col += 1
-            worksheet.write(row, col, str(item.get("lastfm_playcount", ""))); col += 1
-            worksheet.write(row, col, str(item.get("lastfm_listeners", ""))); col += 1
-            worksheet.write(row, col, str(item.get("popularity", item.get("spotify_popularity", "")))); col += 1
-            
-            # Audio Features
-            worksheet.write(row, col, str(item.get("tempo", ""))); col += 1
-            worksheet.write(row, col, str(item.get("key", ""))); col += 1
-            worksheet.write(row, col, str(item.get("mode", ""))); col += 1
-            worksheet.write(row, col, str(item.get("time_signature", ""))); col += 1
-            worksheet.write(row, col, str(item.get("energy", ""))); col += 1
-            worksheet.write(row, col, str(item.get("danceability", ""))); col += 1
-            worksheet.write(row, col, str(item.get("valence", ""))); col += 1
-            worksheet.write(row, col, str(item.get("loudness", ""))); col += 1
-            worksheet.write(row, col, str(item.get("speechiness", ""))); col += 1
-            worksheet.write(row, col, str(item.get("acousticness", ""))); col += 1
-            worksheet.write(row, col, str(item.get("instrumentalness", ""))); col += 1
-            worksheet.write(row, col, str(item.get("liveness", ""))); col += 1
-            
-            # Genre & Tags
-            genres = item.get("genres", [])
-            if isinstance(genres, list):
-                worksheet.write(row, col, ", ".join(genres))
-            else:
-                worksheet.write(row, col, str(genres) if genres else "")
-            col += 1
-            
-            styles = item.get("styles", [])
-            if isinstance(styles, list):
-                worksheet.write(row, col, ", ".join(styles))
-            else:
-                worksheet.write(row, col, str(styles) if styles else "")
-            col += 1
-            
-            tags = item.get("tags", [])
-            if isinstance(tags, list):
-                worksheet.write(row, col, ", ".join(tags))
-            else:
-                worksheet.write(row, col, str(tags) if tags else "")
-            col += 1
-            
-            # Label & Publishing
-            worksheet.write(row, col, str(item.get("label", ""))); col += 1
-            worksheet.write(row, col, str(item.get("catalog_number", ""))); col += 1
-            
-            # Quality Metrics with color coding
-            confidence = item.get("confidence_score", item.get("confidence", 0))
-            if confidence >= 80:
-                worksheet.write(row, col, confidence, high_confidence)
-            elif confidence >= 60:
-                worksheet.write(row, col, confidence, medium_confidence)
-            else:
-                worksheet.write(row, col, confidence, low_confidence)
-            col += 1
-            
-            worksheet.write(row, col, item.get("data_completeness", 0)); col += 1
-            worksheet.write(row, col, item.get("quality_rating", "")); col += 1
-            
-            # Sources
-            sources = item.get("sources", [])
-            if isinstance(sources, list):
-                worksheet.write(row, col, ", ".join(str(s) for s in sources))
-            else:
-                worksheet.write(row, col, str(sources))
-        
-        # Add Credits sheet
+        # Credits sheet is set up before the data pass so each track's credits
+        # are written while the track is in hand
         credits_sheet = workbook.add_worksheet('Credits')
-        credits_sheet.merge_range(0, 0, 0, 4, 'Track Credits', title_format)
+        credits_sheet.write(0, 0, 'Track Credits', title_format)
         
         credit_headers = ['ISRC', 'Credit Type', 'Name', 'Role Details', 'Source']
-        for col, header in enumerate(credit_headers):
-            credits_sheet.write(2, col, header, header_format)
+        credits_sheet.write_row(2, 0, credit_headers, header_format)
         
+        credits_sheet.set_column(0, 0, 12)
+        credits_sheet.set_column(1, 1, 20)
+        credits_sheet.set_column(2, 2, 30)
+        credits_sheet.set_column(3, 3, 40)
+        credits_sheet.set_column(4, 4, 15)
+        
+        # One pass over the export: metadata row, its links, its credits and the
+        # summary statistics. Each sheet is still written top to bottom.
+        total_tracks = len(metadata_list)
+        confidence_total = 0.0
+        spotify_found = youtube_found = musicbrainz_found = 0
+        # Each track lists a source at most once, so counting names gives per-source coverage
+        source_counts: Counter[str] = Counter()
         credit_row = 3
-        for item in metadata_list:
+        links_written = 0
+        for row_idx, item in enumerate(metadata_list):
+            row = row_idx + 5
+            row_values = _excel_row(item)
+            worksheet.write_row(row, 0, row_values)
+            
+            # write_url is the cheaper call but is capped per sheet; formulas carry
+            # large exports past the cap
+            for col, url, label in _excel_links(item):
+                if links_written < EXCEL_HYPERLINK_LIMIT:
+                    worksheet.write_url(row, col, url, string=label)
+                    links_written += 1
+                elif len(url) <= EXCEL_FORMULA_URL_MAX:
+                    worksheet.write_formula(row, col, _excel_hyperlink(url, label), link_format, label)
+                else:
+                    worksheet.write(row, col, label)
+            
             credits = item.get("credits", [])
             if credits:
+                isrc = item.get("isrc", "")
                 for credit in credits:
                     if isinstance(credit, dict):
-                        credits_sheet.write(credit_row, 0, item.get("isrc", ""))
-                        credits_sheet.write(credit_row, 1, credit.get("credit_type", ""))
-                        credits_sheet.write(credit_row, 2, credit.get("name", credit.get("person_name", "")))
-                        credits_sheet.write(credit_row, 3, str(credit.get("role_details", "")))
-                        credits_sheet.write(credit_row, 4, credit.get("source_api", credit.get("source", "")))
+                        credits_sheet.write_row(credit_row, 0, (
+                            isrc,
+                            credit.get("credit_type", ""),
+                            credit.get("name", credit.get("person_name", "")),
+                            str(credit.get("role_details", "")),
+                            credit.get("source_api", credit.get("source", ""))
+                        ))
                         credit_row += 1
-        
-        credits_sheet.set_column(0, 0, 12)
-        credits_sheet.set_column(1, 1, 20)
-        credits_sheet.set_column(2, 2, 30)
-        credits_sheet.set_column(3, 3, 40)
-        credits_sheet.set_column(4, 4, 15)
+            
+            confidence_total += row_values[EXCEL_CONFIDENCE_COLUMN]
+            if item.get("spotify_id"):
+                spotify_found += 1
+            if item.get("youtube_video_id"):
+                youtube_found += 1
+            if item.get("musicbrainz_id") or item.get("musicbrainz_recording_id"):
+                musicbrainz_found += 1
+            source_counts.update(item.get("sources") or ())
+        
+        # Quality Metrics color coding, applied by Excel over the whole column
+        if metadata_list:
+            last_row = len(metadata_list) + 4
+            for criteria, value, band in EXCEL_CONFIDENCE_BANDS:
+                worksheet.conditional_format(5, EXCEL_CONFIDENCE_COLUMN, last_row, EXCEL_CONFIDENCE_COLUMN, {
+                    'type': 'cell',
+                    'criteria': criteria,
+                    'value': value,
+                    'format': formats[band],
+                    'stop_if_true': True
+                })
         
         # Add summary sheet
         summary_sheet = workbook.add_worksheet('Summary')
         
         # Summary branding
-        summary_sheet.merge_range(0, 0, 0, 1, 'Analysis Summary', title_format)
-        summary_sheet.merge_range(1, 0, 1, 1, f'Analysis Date: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}', subtitle_format)
+        summary_sheet.write(0, 0, 'Analysis Summary', title_format)
+        summary_sheet.write(1, 0, f'Analysis Date: {generated_at}', subtitle_format)
         
         # Summary headers
         summary_headers = ['Metric', 'Value']
-        for col, header in enumerate(summary_headers):
-            summary_sheet.write(3, col, header, header_format)
+        summary_sheet.write_row(3, 0, summary_headers, header_format)
         
-        # Calculate statistics
-        total_tracks = len(metadata_list)
-        avg_confidence = sum(item.get("confidence_score", item.get("confidence", 0)) for item in metadata_list) / max(total_tracks, 1)
-        spotify_found = sum(1 for item in metadata_list if item.get("spotify_id"))
-        youtube_found = sum(1 for item in metadata_list if item.get("youtube_video_id"))
-        musicbrainz_found = sum(1 for item in metadata_list if item.get("musicbrainz_id") or item.get("musicbrainz_recording_id"))
-        genius_found = sum(1 for item in metadata_list if "Genius" in item.get("sources", []))
-        lastfm_found = sum(1 for item in metadata_list if "Lastfm" in item.get("sources", []))
-        discogs_found = sum(1 for item in metadata_list if "Discogs" in item.get("sources", []))
+        avg_confidence = confidence_total / max(total_tracks, 1)
+        
+        def coverage(found: int) -> str:
+            if total_tracks == 0:
+                return '0/0 (0%)'
+            return f'{found}/{total_tracks} ({found/total_tracks*100:.1f}%)'
         
         # Write summary statistics
         stats = [
@@ -1109,12 +1574,12 @@ class ExportService:
             ('Average Confidence', f'{avg_confidence:.1f}%'),
             ('', ''),
             ('Platform Coverage', ''),
-            ('Spotify Coverage', f'{spotify_found}/{total_tracks} ({spotify_found/total_tracks*100:.1f}%)' if total_tracks > 0 else '0/0 (0%)'),
-            ('YouTube Coverage', f'{youtube_found}/{total_tracks} ({youtube_found/total_tracks*100:.1f}%)' if total_tracks > 0 else '0/0 (0%)'),
-            ('MusicBrainz Coverage', f'{musicbrainz_found}/{total_tracks} ({musicbrainz_found/total_tracks*100:.1f}%)' if total_tracks > 0 else '0/0 (0%)'),
-            ('Genius Coverage', f'{genius_found}/{total_tracks} ({genius_found/total_tracks*100:.1f}%)' if total_tracks > 0 else '0/0 (0%)'),
-            ('Last.fm Coverage', f'{lastfm_found}/{total_tracks} ({lastfm_found/total_tracks*100:.1f}%)' if total_tracks > 0 else '0/0 (0%)'),
-            ('Discogs Coverage', f'{discogs_found}/{total_tracks} ({discogs_found/total_tracks*100:.1f}%)' if total_tracks > 0 else '0/0 (0%)'),
+            ('Spotify Coverage', coverage(spotify_found)),
+            ('YouTube Coverage', coverage(youtube_found)),
+            ('MusicBrainz Coverage', coverage(musicbrainz_found)),
+            ('Genius Coverage', coverage(source_counts['Genius'])),
+            ('Last.fm Coverage', coverage(source_counts['Lastfm'])),
+            ('Discogs Coverage', coverage(source_counts['Discogs'])),
         ]
         
         # Add database statistics if available
@@ -1129,34 +1594,66 @@ class ExportService:
             ])
         
         for row_idx, (metric, value) in enumerate(stats):
-            summary_sheet.write(row_idx + 4, 0, metric)
-            summary_sheet.write(row_idx + 4, 1, str(value))
+            summary_sheet.write_row(row_idx + 4, 0, (metric, str(value)))
         
         summary_sheet.set_column(0, 0, 25)
         summary_sheet.set_column(1, 1, 35)
         
         workbook.close()
-        output.seek(0)
-        
-        return output
 
 # Helper functions for validation
+_ISRC_RE = re.compile(r'[A-Z]{2}[A-Z0-9]{3}[0-9]{7}')
+_ISRC_STRIP_RE = re.compile(r'[-\s]')
+# Separators users paste between ISRCs: commas, semicolons, newlines, tabs and spaces
+_ISRC_SEP = re.compile(r'[,;\s]+')
+
 def validate_isrc(isrc: str) -> bool:
     """Validate ISRC format"""
     if not isrc:
         return False
-    pattern = r'^[A-Z]{2}[A-Z0-9]{3}[0-9]{7}$'
-    return bool(re.match(pattern, isrc.upper().strip()))
+    return _ISRC_RE.fullmatch(isrc.upper().strip()) is not None
 
 def clean_isrc(isrc: str) -> str:
     """Clean ISRC format"""
     if not isrc:
         return ""
     # Remove any hyphens, spaces, and convert to uppercase
-    cleaned = re.sub(r'[-\s]', '', isrc.upper().strip())
-    return cleaned
+    cleaned = isrc.upper().replace('-', '').strip()
+    # Plain alphanumeric input is already clean; only fall back to the regex for whitespace
+    if cleaned.isalnum():
+        return cleaned
+    return _ISRC_STRIP_RE.sub('', cleaned)
+
+def clean_valid_isrcs(isrcs: Iterable[str]) -> list[str]:
+    """Clean each ISRC once and keep the distinct valid ones in input order"""
+    return list(dict.fromkeys(isrc for raw in isrcs if _ISRC_RE.fullmatch(isrc := clean_isrc(raw))))
+
+def parse_isrc_list(isrc_text: str) -> list[str]:
+    """Split a pasted list of ISRCs and keep the cleaned, valid ones"""
+    tokens = _ISRC_SEP.split(isrc_text.strip())
+    # Tokens carry no whitespace, so cleaning is an uppercase and hyphen strip,
+    # and the cleaned value is already in the form the pattern expects
+    return [isrc for token in tokens if _ISRC_RE.fullmatch(isrc := token.upper().replace("-", ""))]
 
 # ============= APPLICATION FACTORY =============
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the UI page at startup and release shared resources on shutdown"""
+    logger.info(f"🌐 Shared HTTP client ready (HTTP/2: {'on' if HTTP2_AVAILABLE else 'off'})")
+    # Read and compress the page before serving so no request pays for disk IO on the event loop
+    body, gzipped, _ = load_index_assets()
+    logger.info(f"📄 UI page cached ({len(body)} bytes, {len(gzipped)} gzipped)")
+    if app.state.config.WARMUP_API_CLIENTS:
+        # Token fetch and TLS handshakes happen here instead of on the first analysis
+        await app.state.api_clients.warmup()
+    try:
+        yield
+    finally:
+        await _shutdown_export_jobs()
+        await app.state.http_client.aclose()
+        logger.info("🌐 Shared HTTP client closed")
+        app.state.db_manager.close()
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application"""
     
@@ -1165,7 +1662,9 @@ def create_app() -> FastAPI:
         description="Music Metadata Intelligence Platform",
         version="2.1.0",
         docs_url="/api/docs",
-        redoc_url="/api/redoc"
+        redoc_url="/api/redoc",
+        default_response_class=FastJSONResponse,
+        lifespan=lifespan
     )
     
     # Add CORS middleware
@@ -1177,6 +1676,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"]
     )
     
+    # Compress larger JSON/CSV responses; the UI page is served pre-compressed
+    app.add_middleware(GZipMiddleware, minimum_size=512)
+    
     # Initialize services
     config = Config()
     api_config = config.get_api_config()
@@ -1186,9 +1688,13 @@ def create_app() -> FastAPI:
     
     # Initialize cache with database
     cache = MetadataCache(db_manager)
+    cache.warm_database()
+    
+    # Shared outbound HTTP client for all provider calls
+    http_client = create_http_client(timeout=10.0)
     
     # Initialize API clients
-    api_clients = APIClientManager(api_config)
+    api_clients = APIClientManager(api_config, http_client=http_client)
     
     # Initialize metadata collector with the database manager
     metadata_collector = AsyncMetadataCollector(api_clients, db_manager)
@@ -1199,6 +1705,8 @@ def create_app() -> FastAPI:
     
     # Store in app state
     app.state.config = config
+    app.state.export_jobs = {}
+    app.state.http_client = http_client
     app.state.db_manager = db_manager
     app.state.cache = cache
     app.state.api_clients = api_clients
@@ -1220,53 +1728,120 @@ if static_dir.exists():
 
 # ============= ROUTES =============
 
+INDEX_TEMPLATE_PATHS = (Path("templates/index.html"), Path("templates/enhanced_index.html"))
+FALLBACK_INDEX_HTML = "<h1>PRISM UI not found</h1><p>Place index.html in /templates directory.</p>"
+
+@lru_cache(maxsize=1)
+def load_index_html() -> str:
+    """Read the UI template once per process; template edits need a restart"""
+    for template_path in INDEX_TEMPLATE_PATHS:
+        if template_path.exists():
+            return template_path.read_text(encoding='utf-8')
+    return FALLBACK_INDEX_HTML
+
+# Conditional GET support: clients that send back the ETag get an empty 304
+ETAG_CACHE_CONTROL = "private, max-age=30"
+
+def make_etag(*parts: Any) -> str:
+    """Weak ETag from a stable hash of the values that identify a response version"""
+    digest = hashlib.blake2b(json_dumps_bytes(parts), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names this version"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+def etag_response(request: Request, etag: str, content: Any) -> Response:
+    """Return 304 when the client holds this version, else the tagged JSON body"""
+    headers = {"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return FastJSONResponse(content, headers=headers)
+
+@lru_cache(maxsize=1)
+def load_index_assets() -> tuple[bytes, bytes, str]:
+    """UI page as raw bytes, pre-gzipped bytes and a weak ETag, built once"""
+    body = load_index_html().encode("utf-8")
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    return body, gzip.compress(body, 9), etag
+
 @app.get("/", response_class=HTMLResponse)
-async def root():
+async def root(request: Request):
     """Serve main interface with fallback to embedded HTML"""
-    template_paths = [Path("templates/index.html"), Path("templates/enhanced_index.html")]
-    for template_path in template_paths:
-        if template_path.exists():
-            return HTMLResponse(content=template_path.read_text(encoding='utf-8'))
-    return HTMLResponse(content="<h1>PRISM UI not found</h1><p>Place index.html in /templates directory.</p>")
+    body, gzipped, etag = load_index_assets()
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600", "Vary": "Accept-Encoding"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    # Content-Encoding set here makes GZipMiddleware pass the body through untouched
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return HTMLResponse(content=gzipped, headers=headers)
+    return HTMLResponse(content=body, headers=headers)
+
+# Health checks are polled by the host platform; the rendered body is reused briefly
+HEALTH_CACHE_SECONDS = 5
+_health_cache = TTLCache(maxsize=1, ttl_seconds=HEALTH_CACHE_SECONDS)
 
 @app.get("/api/health")
 async def health_check():
     """Comprehensive health check endpoint"""
-    db_stats = app.state.db_manager.get_analysis_stats()
-    api_status = await app.state.api_clients.validate_clients_async()
+    body = _health_cache.get("health")
+    if body is None:
+        db_stats = await run_in_threadpool(app.state.db_manager.get_analysis_stats)
+        body = json_dumps_bytes({
+            "status": "healthy",
+            "service": "PRISM Analytics Engine",
+            "version": "2.1.0",
+            "timestamp": datetime.now().isoformat(),
+            "database": db_stats,
+            # Client availability is fixed at startup, so a plain attribute check suffices
+            "apis": app.state.api_clients.validate_clients(),
+            "features": {
+                "excel_export": EXCEL_AVAILABLE,
+                "enhanced_confidence": True,
+                "database_storage": True,
+                "cache_with_fallback": True,
+                "genius_integration": GENIUS_ENABLED
+            }
+        })
+        _health_cache.set("health", body)
     
-    return {
-        "status": "healthy",
-        "service": "PRISM Analytics Engine",
-        "version": "2.1.0",
-        "timestamp": datetime.now().isoformat(),
-        "database": db_stats,
-        "apis": api_status,
-        "features": {
-            "excel_export": EXCEL_AVAILABLE,
-            "enhanced_confidence": True,
-            "database_storage": True,
-            "cache_with_fallback": True,
-            "genius_integration": bool(os.getenv("GENIUS_API_KEY"))
-        }
-    }
+    return Response(content=body, media_type="application/json")
 
 @app.get("/api/stats")
-async def get_statistics():
+async def get_statistics(http_request: Request):
     """Get comprehensive database statistics"""
-    return app.state.db_manager.get_analysis_stats()
+    stats = await run_in_threadpool(app.state.db_manager.get_analysis_stats)
+    return etag_response(http_request, make_etag(stats), stats)
+
+@app.post("/api/cache/clear")
+async def clear_provider_cache():
+    """Clear the in-memory per-provider response cache"""
+    cleared = app.state.metadata_collector.clear_provider_cache()
+    return {
+        "cleared": cleared,
+        "timestamp": datetime.now().isoformat()
+    }
+
+def _track_etag(track: dict[str, Any]) -> str:
+    """A track response changes whenever it is re-analyzed or re-scored"""
+    return make_etag(track.get("isrc"), track.get("last_updated"), track.get("confidence_score"))
 
 @app.post("/api/analyze-enhanced")
-async def analyze_enhanced(request: ISRCAnalysisRequest):
+async def analyze_enhanced(request: ISRCAnalysisRequest, http_request: Request):
     """Enhanced ISRC analysis with confidence scoring"""
-    isrc = clean_isrc(request.isrc)
-    if not validate_isrc(isrc):
+    isrc = request.isrc
+    if not _ISRC_RE.fullmatch(isrc):
         raise HTTPException(status_code=400, detail="Invalid ISRC format")
     
     if not request.force_refresh:
-        cached_data = app.state.cache.get(isrc)
+        cached_data = await run_in_threadpool(app.state.cache.get, isrc)
         if cached_data:
-            return cached_data
+            return etag_response(http_request, _track_etag(cached_data), cached_data)
     
     try:
         result = await app.state.metadata_collector.analyze_isrc_async(
@@ -1274,18 +1849,17 @@ async def analyze_enhanced(request: ISRCAnalysisRequest):
             comprehensive=request.include_lyrics
         )
         
-        lyrics_data = None
+        lyrics_data = found_lyrics = None
         if request.include_lyrics and result.get("title") and result.get("artist"):
-            lyrics_data = await get_genius_lyrics(isrc, result["title"], result["artist"])
+            lyrics_data = await get_genius_lyrics(
+                isrc, result["title"], result["artist"], app.state.http_client
+            )
             if "error" not in lyrics_data:
+                found_lyrics = lyrics_data
                 result["has_lyrics"] = True
                 result["lyrics_data"] = lyrics_data
                 if "Genius" not in result.get("sources", []):
                     result["sources"].append("Genius")
-                
-                app.state.db_manager.save_lyrics(isrc, lyrics_data)
-                if lyrics_data.get("credits"):
-                    app.state.db_manager.save_credits(isrc, lyrics_data["credits"])
         
         confidence_data = app.state.confidence_scorer.calculate_score(result, lyrics_data)
         result.update({
@@ -1296,46 +1870,117 @@ async def analyze_enhanced(request: ISRCAnalysisRequest):
             "confidence_details": confidence_data
         })
         
-        app.state.cache.set(isrc, result)
-        return result
+        # Track, cache entry, lyrics and credits are committed together; an empty
+        # Genius credit list leaves credits stored by other sources in place
+        await run_in_threadpool(
+            app.state.cache.set, isrc, result,
+            lyrics_data=found_lyrics,
+            credits=(found_lyrics.get("credits") or None) if found_lyrics else None
+        )
+        return etag_response(http_request, _track_etag(result), result)
         
     except Exception as e:
         logger.error(f"Analysis failed for {isrc}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _export_metadata(isrc: str, semaphore: asyncio.Semaphore, include_details: bool) -> dict[str, Any] | None:
+    """Freshly analyzed and scored metadata for one exported ISRC"""
+    async with semaphore:
+        result = await app.state.metadata_collector.analyze_isrc_async(isrc, comprehensive=False)
+    confidence_data = app.state.confidence_scorer.calculate_score(result)
+    result.update({
+        "confidence_score": confidence_data["confidence_score"],
+        "data_completeness": confidence_data["data_completeness"],
+        "quality_rating": confidence_data["quality_rating"]
+    })
+    if include_details:
+        result["confidence_details"] = confidence_data
+    return result
+
+async def iter_bulk_metadata(isrc_list: list[str], include_details: bool = False,
+                             on_complete: Callable[[], None] | None = None) -> AsyncIterator[dict[str, Any]]:
+    """Analyze valid ISRCs concurrently, yielding results in input order as they become ready
+
+    Fresh results are cached together in one write once iteration ends or is abandoned.
+    """
+    # Phase 1: one batched cache lookup for the distinct ISRCs
+    unique_isrcs = list(dict.fromkeys(isrc_list))
+    ready: dict[str, dict[str, Any] | None] = await run_in_threadpool(app.state.cache.get_many, unique_isrcs)
+    
+    # Phase 2: analyze only the misses, each at most once. The semaphore only caps
+    # ISRCs in flight; upstream calls are paced per host by the API clients
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+    tasks = {
+        isrc: asyncio.ensure_future(_export_metadata(isrc, semaphore, include_details))
+        for isrc in unique_isrcs if isrc not in ready
+    }
+    if on_complete:
+        # Progress is reported in completion order, independent of the yield order
+        for _ in ready:
+            on_complete()
+        for task in tasks.values():
+            task.add_done_callback(lambda _task: on_complete())
+    
+    fresh: dict[str, dict[str, Any]] = {}
+    try:
+        # Awaiting in order holds back later results until earlier ones finish,
+        # while every task keeps running in the background
+        for isrc in isrc_list:
+            if isrc not in ready:
+                try:
+                    ready[isrc] = fresh[isrc] = await tasks[isrc]
+                except Exception as e:
+                    logger.error(f"Failed to analyze {isrc}: {e}")
+                    ready[isrc] = None
+            result = ready[isrc]
+            if result:
+                yield result
+    finally:
+        # Client disconnects close the generator early; drop the outstanding work
+        for task in tasks.values():
+            task.cancel()
+        fresh = {isrc: data for isrc, data in fresh.items() if data}
+        if fresh:
+            await run_in_threadpool(app.state.cache.set_many, fresh)
+
+async def collect_bulk_metadata(isrc_list: list[str], include_details: bool = False) -> list[dict[str, Any]]:
+    """Analyze validated ISRCs concurrently for an export, keeping input order and skipping failures"""
+    return [item async for item in iter_bulk_metadata(isrc_list, include_details)]
+
+async def stream_bulk_csv(isrc_list: list[str]) -> AsyncIterator[str]:
+    """CSV export of validated ISRCs that sends each row once it and every row before it are ready"""
+    export_service = app.state.export_service
+    yield export_service.csv_preamble(len(isrc_list), REQUESTED_ISRCS_LABEL)
+    
+    renderer = CSVRowRenderer()
+    include_header = True
+    async for item in iter_bulk_metadata(isrc_list):
+        yield renderer.render(item, include_header=include_header)
+        include_header = False
+
+async def gzip_stream(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Gzip a text stream, sync-flushing after each chunk so the client can decode it right away"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        yield compressor.compress(chunk.encode("utf-8")) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
 @app.get("/api/bulk-csv")
-async def bulk_csv_export(isrcs: str = Query(..., description="Comma-separated ISRCs")):
+async def bulk_csv_export(request: Request, isrcs: str = Query(..., description="Comma-separated ISRCs")):
     """Bulk CSV export with ALL fields"""
-    isrc_list = [clean_isrc(isrc) for isrc in isrcs.split(",") if isrc.strip()]
+    isrc_list = parse_isrc_list(isrcs)
     if not isrc_list:
         raise HTTPException(status_code=400, detail="No valid ISRCs provided")
     
-    metadata_list = []
-    for isrc in isrc_list:
-        if not validate_isrc(isrc): continue
-        try:
-            cached_data = app.state.cache.get(isrc)
-            if cached_data:
-                metadata_list.append(cached_data)
-            else:
-                result = await app.state.metadata_collector.analyze_isrc_async(isrc, comprehensive=False)
-                confidence_data = app.state.confidence_scorer.calculate_score(result)
-                result.update({
-                    "confidence_score": confidence_data["confidence_score"],
-                    "data_completeness": confidence_data["data_completeness"],
-                    "quality_rating": confidence_data["quality_rating"]
-                })
-                metadata_list.append(result)
-                app.state.cache.set(isrc, result)
-        except Exception as e:
-            logger.error(f"Failed to analyze {isrc}: {e}")
-    
-    csv_content = app.state.export_service.create_csv(metadata_list)
-    return Response(
-        content=csv_content,
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename=prism_metadata_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"}
-    )
+    headers = {"Content-Disposition": f"attachment; filename=prism_metadata_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"}
+    body = stream_bulk_csv(isrc_list)
+    # GZipMiddleware never flushes its compressor mid-stream and would hold rows back
+    # until a deflate block fills; with Content-Encoding set here it passes this through
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+        body = gzip_stream(body)
+    return StreamingResponse(body, media_type="text/csv", headers=headers)
 
 @app.get("/api/bulk-excel")
 async def bulk_excel_export(isrcs: str = Query(..., description="Comma-separated ISRCs")):
@@ -1343,57 +1988,167 @@ async def bulk_excel_export(isrcs: str = Query(..., description="Comma-separated
     if not EXCEL_AVAILABLE:
         raise HTTPException(status_code=500, detail="Excel export not available. Install xlsxwriter.")
     
-    isrc_list = [clean_isrc(isrc) for isrc in isrcs.split(",") if isrc.strip()]
+    isrc_list = parse_isrc_list(isrcs)
     if not isrc_list:
         raise HTTPException(status_code=400, detail="No valid ISRCs provided")
     
-    metadata_list = []
-    for isrc in isrc_list:
-        if not validate_isrc(isrc): continue
-        try:
-            cached_data = app.state.cache.get(isrc)
-            if cached_data:
-                metadata_list.append(cached_data)
-            else:
-                result = await app.state.metadata_collector.analyze_isrc_async(isrc, comprehensive=False)
-                confidence_data = app.state.confidence_scorer.calculate_score(result)
-                result.update({
-                    "confidence_score": confidence_data["confidence_score"],
-                    "data_completeness": confidence_data["data_completeness"],
-                    "quality_rating": confidence_data["quality_rating"],
-                    "confidence_details": confidence_data
-                })
-                metadata_list.append(result)
-                app.state.cache.set(isrc, result)
-        except Exception as e:
-            logger.error(f"Failed to analyze {isrc}: {e}")
+    metadata_list = await collect_bulk_metadata(isrc_list, include_details=True)
     
-    db_stats = app.state.db_manager.get_analysis_stats()
-    excel_file = app.state.export_service.create_excel(metadata_list, db_stats)
+    db_stats = await run_in_threadpool(app.state.db_manager.get_analysis_stats)
+    # Rows are flushed to disk as they are written; the file is removed once sent
+    excel_path = await run_in_threadpool(app.state.export_service.create_excel_file, metadata_list, db_stats)
     
-    return StreamingResponse(
-        excel_file,
+    return FileResponse(
+        excel_path,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f"attachment; filename=prism_metadata_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"}
+        filename=f"prism_metadata_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+        background=BackgroundTask(os.unlink, excel_path)
+    )
+
+# ============= BACKGROUND EXPORT JOBS =============
+# Jobs live in this process only; finished ones are dropped after download or once stale
+EXPORT_JOB_TTL_SECONDS = 3600
+EXPORT_MEDIA_TYPES = {
+    "csv": ("text/csv", "csv"),
+    "excel": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx"),
+}
+EXPORT_JOB_FIELDS = ("job_id", "status", "format", "total", "processed", "exported", "error", "created_at")
+
+def _discard_export_job(job_id: str) -> None:
+    """Forget a job and remove its output file"""
+    job = app.state.export_jobs.pop(job_id, None)
+    if job and job.get("file_path"):
+        Path(job["file_path"]).unlink(missing_ok=True)
+
+async def _shutdown_export_jobs() -> None:
+    """Cancel running jobs and remove every job's output file"""
+    jobs = list(app.state.export_jobs.values())
+    running = [job["task"] for job in jobs if not job["task"].done()]
+    for task in running:
+        task.cancel()
+    await asyncio.gather(*running, return_exceptions=True)
+    for job in jobs:
+        _discard_export_job(job["job_id"])
+
+async def _run_export_job(job: dict[str, Any], isrc_list: list[str]) -> None:
+    """Analyze the job's ISRCs and write the export to a temp file"""
+    def advance() -> None:
+        job["processed"] += 1
+    
+    export_service = app.state.export_service
+    try:
+        if job["format"] == "csv":
+            with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, encoding="utf-8", newline="") as handle:
+                job["file_path"] = handle.name
+                handle.write(export_service.csv_preamble(len(isrc_list), REQUESTED_ISRCS_LABEL))
+                # Rows go straight through csv.writer into the file, no per-row strings
+                writer = csv.writer(handle)
+                async for item in iter_bulk_metadata(isrc_list, on_complete=advance):
+                    if job["exported"] == 0:
+                        writer.writerow(CSV_FIELDNAMES)
+                    writer.writerow(_csv_row(item))
+                    job["exported"] += 1
+        else:
+            metadata_list = [
+                item async for item in iter_bulk_metadata(isrc_list, include_details=True, on_complete=advance)
+            ]
+            job["exported"] = len(metadata_list)
+            db_stats = await run_in_threadpool(app.state.db_manager.get_analysis_stats)
+            job["file_path"] = await run_in_threadpool(export_service.create_excel_file, metadata_list, db_stats)
+        job["status"] = "complete"
+    except Exception as e:
+        logger.error(f"Export job {job['job_id']} failed: {e}")
+        job["status"] = "failed"
+        job["error"] = str(e)
+    finally:
+        job["finished_at"] = time.time()
+        # Undownloaded output is removed once stale; a download discards it sooner
+        asyncio.get_running_loop().call_later(EXPORT_JOB_TTL_SECONDS, _discard_export_job, job["job_id"])
+
+def _export_job_or_404(job_id: str) -> dict[str, Any]:
+    """Look up a job, raising 404 for unknown or expired ids"""
+    job = app.state.export_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return job
+
+@app.post("/api/bulk/start")
+async def start_bulk_export(request: ExportRequest):
+    """Start a bulk export in the background and return a job id to poll"""
+    if request.format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="Export format must be csv or excel")
+    if request.format == "excel" and not EXCEL_AVAILABLE:
+        raise HTTPException(status_code=500, detail="Excel export not available. Install xlsxwriter.")
+    
+    isrc_list = clean_valid_isrcs(request.isrcs)
+    if not isrc_list:
+        raise HTTPException(status_code=400, detail="No valid ISRCs provided")
+    
+    job_id = uuid.uuid4().hex
+    job = {
+        "job_id": job_id,
+        "status": "running",
+        "format": request.format,
+        "total": len(isrc_list),
+        "processed": 0,
+        "exported": 0,
+        "error": None,
+        "created_at": datetime.now().isoformat(),
+        "finished_at": None,
+        "file_path": None,
+    }
+    app.state.export_jobs[job_id] = job
+    job["task"] = asyncio.create_task(_run_export_job(job, isrc_list))
+    return {field: job[field] for field in EXPORT_JOB_FIELDS}
+
+@app.get("/api/bulk/{job_id}")
+async def get_bulk_export(job_id: str):
+    """Progress of a background export"""
+    job = _export_job_or_404(job_id)
+    return {field: job[field] for field in EXPORT_JOB_FIELDS}
+
+@app.get("/api/bulk/{job_id}/download")
+async def download_bulk_export(job_id: str):
+    """Download a finished export; the job and its file are removed afterwards"""
+    job = _export_job_or_404(job_id)
+    if job["status"] != "complete":
+        raise HTTPException(status_code=409, detail=f"Export job is {job['status']}")
+    
+    media_type, extension = EXPORT_MEDIA_TYPES[job["format"]]
+    return FileResponse(
+        job["file_path"],
+        media_type=media_type,
+        filename=f"prism_metadata_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}",
+        background=BackgroundTask(_discard_export_job, job_id)
     )
 
 @app.post("/api/bulk-analyze")
 async def bulk_analyze(request: BulkAnalysisRequest):
     """Bulk analysis with progress tracking"""
+    # Malformed ISRCs are reported straight away instead of going through the collector
+    valid_isrcs: list[str] = []
+    invalid: list[dict[str, str]] = []
+    for isrc in request.isrcs:
+        if _ISRC_RE.fullmatch(isrc):
+            valid_isrcs.append(isrc)
+        else:
+            invalid.append({"isrc": isrc, "error": "Invalid ISRC format"})
+    
     results, errors = await app.state.metadata_collector.bulk_analyze_async(
-        request.isrcs,
+        valid_isrcs,
         comprehensive=request.include_lyrics
     )
+    errors.extend(invalid)
     
-    for result in results:
-        confidence_data = app.state.confidence_scorer.calculate_score(result)
+    scored = app.state.confidence_scorer.calculate_scores_bulk(results)
+    for result, confidence_data in zip(results, scored):
         result.update({
             "confidence_score": confidence_data["confidence_score"],
             "data_completeness": confidence_data["data_completeness"],
             "quality_rating": confidence_data["quality_rating"],
             "confidence_details": confidence_data
         })
-        app.state.cache.set(result["isrc"], result)
+    await run_in_threadpool(app.state.cache.set_many, {result["isrc"]: result for result in results})
     
     return {
         "success": len(results),
@@ -1460,7 +2215,7 @@ if __name__ == "__main__":
     print("\n✨ Enhanced Features:")
     print(f"  • Comprehensive Excel Export: {'✅' if EXCEL_AVAILABLE else '❌ Install xlsxwriter'}")
     print(f"  • Database Storage with Cache Fallback: ✅")
-    print(f"  • Genius API Integration: {'✅' if os.getenv('GENIUS_API_KEY') else '⚠️ Set GENIUS_API_KEY'}")
+    print(f"  • Genius API Integration: {'✅' if GENIUS_ENABLED else '⚠️ Set GENIUS_API_KEY'}")
     print(f"  • Enhanced Confidence Scoring: ✅")
     print(f"  • Async Processing: ✅")
     print(f"  • Multi-Source Aggregation: ✅")
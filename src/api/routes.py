@@ -4,21 +4,44 @@ RESTful API endpoints for metadata analysis
 """
 
 from fastapi import APIRouter, HTTPException, Query, UploadFile, File, BackgroundTasks, Request, Depends
-from fastapi.responses import Response, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel, Field
 from typing import Any  # Still need Any from typing
+import asyncio
 import json
 import io
+import os
 import csv
 from datetime import datetime
 import logging
 import re
 
+from sqlalchemy import bindparam, func, select
+
+from src.models.database import Track, TrackLyrics
+
 logger = logging.getLogger(__name__)
 
 # Create API router
 router = APIRouter(prefix="/api/v1", tags=["metadata"])
 
+# ============= PREBUILT QUERIES =============
+# Built once at import; SQLAlchemy caches their compiled form across calls
+
+_GET_TRACK = select(Track).where(Track.isrc == bindparam("isrc"))
+
+_TRACK_STATS = select(
+    func.count(),
+    func.count(Track.spotify_id),
+    func.count(Track.youtube_video_id),
+    func.count(Track.musicbrainz_recording_id),
+    func.avg(func.coalesce(Track.confidence_score, 0)),
+    func.avg(func.coalesce(Track.data_completeness, 0)),
+    select(func.count()).select_from(TrackLyrics).scalar_subquery()
+).select_from(Track)
+
 # ============= REQUEST/RESPONSE MODELS =============
 
 class ISRCAnalysisRequest(BaseModel):
@@ -99,28 +122,39 @@ async def get_app_state(request: Request) -> dict[str, Any]:
 
 # ============= UTILITY FUNCTIONS =============
 
+# ISRCs analyzed at once by the export route; provider calls are still paced per host
+EXPORT_CONCURRENCY = 16
+
+_ISRC_RE = re.compile(r'[A-Z]{2}[A-Z0-9]{3}[0-9]{7}')
+_ISRC_TEXT_RE = re.compile(r'\b[A-Z]{2}[-\s]?[A-Z0-9]{3}[-\s]?[0-9]{7}\b', re.IGNORECASE)
+_ISRC_STRIP_RE = re.compile(r'[-\s]')
+
 def validate_isrc(isrc: str) -> bool:
     """Validate ISRC format"""
-    pattern = r'^[A-Z]{2}[A-Z0-9]{3}[0-9]{7}$'
-    return bool(re.match(pattern, isrc.upper().strip()))
+    return _ISRC_RE.fullmatch(isrc.upper().strip()) is not None
 
 def clean_isrc(isrc: str) -> str:
     """Clean and normalize ISRC"""
-    cleaned = re.sub(r'[-\s]', '', isrc.upper().strip())
-    return cleaned
+    if not isrc:
+        return ""
+    cleaned = isrc.upper().replace('-', '').strip()
+    return cleaned if cleaned.isalnum() else _ISRC_STRIP_RE.sub('', cleaned)
 
 def extract_isrcs_from_text(text: str) -> list[str]:
-    """Extract ISRCs from text"""
-    pattern = r'\b[A-Z]{2}[-\s]?[A-Z0-9]{3}[-\s]?[0-9]{7}\b'
-    matches = re.findall(pattern, text.upper())
-    
-    isrcs = []
-    for match in matches:
-        cleaned = clean_isrc(match)
-        if validate_isrc(cleaned):
-            isrcs.append(cleaned)
-    
-    return list(set(isrcs))
+    """Extract unique ISRCs from text, preserving first-seen order"""
+    # The pattern already pins every position, so a stripped match is always valid
+    seen: dict[str, None] = {}
+    for match in _ISRC_TEXT_RE.finditer(text):
+        token = match.group(0)
+        if len(token) != 12:
+            token = _ISRC_STRIP_RE.sub('', token)
+        seen.setdefault(token.upper())
+    return list(seen)
+
+def clean_valid_isrcs(isrcs: list[str]) -> list[str]:
+    """Clean each ISRC once and keep the valid ones"""
+    cleaned = (clean_isrc(isrc) for isrc in isrcs)
+    return [isrc for isrc in cleaned if _ISRC_RE.fullmatch(isrc)]
 
 # ============= MAIN ROUTES =============
 
@@ -208,11 +242,7 @@ async def analyze_bulk_isrcs(
     start_time = datetime.now()
     
     # Validate all ISRCs
-    valid_isrcs = []
-    for isrc in request.isrcs:
-        cleaned = clean_isrc(isrc)
-        if validate_isrc(cleaned):
-            valid_isrcs.append(cleaned)
+    valid_isrcs = clean_valid_isrcs(request.isrcs)
     
     if not valid_isrcs:
         raise HTTPException(status_code=400, detail="No valid ISRCs provided")
@@ -256,7 +286,7 @@ async def export_metadata(
     """
     
     # Validate ISRCs
-    valid_isrcs = [clean_isrc(isrc) for isrc in request.isrcs if validate_isrc(clean_isrc(isrc))]
+    valid_isrcs = clean_valid_isrcs(request.isrcs)
     
     if not valid_isrcs:
         raise HTTPException(status_code=400, detail="No valid ISRCs provided")
@@ -270,21 +300,26 @@ async def export_metadata(
     if not collector:
         raise HTTPException(status_code=500, detail="Metadata collector not initialized")
     
-    # Collect metadata for export
-    metadata_list = []
+    # Collect metadata for export concurrently, keeping input order
+    semaphore = asyncio.Semaphore(EXPORT_CONCURRENCY)
     
-    for isrc in valid_isrcs:
-        try:
-            result = await collector.analyze_isrc_async(isrc, comprehensive=False)
+    async def analyze(isrc: str) -> dict[str, Any]:
+        async with semaphore:
+            return await collector.analyze_isrc_async(isrc, comprehensive=False)
+    
+    results = await asyncio.gather(*(analyze(isrc) for isrc in valid_isrcs), return_exceptions=True)
+    metadata_list = []
+    for isrc, result in zip(valid_isrcs, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to get metadata for {isrc}: {result}")
+        else:
             metadata_list.append(result)
-        except Exception as e:
-            logger.error(f"Failed to get metadata for {isrc}: {e}")
     
     # Generate export based on format
     if request.format == "csv":
-        content = export_service.create_csv(metadata_list)
-        return Response(
-            content=content,
+        # Chunks are sent as they are rendered instead of joining the whole document first
+        return StreamingResponse(
+            export_service.iter_csv(metadata_list),
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename=isrc_meta_data_export_{datetime.now().strftime('%Y%m%d')}.csv"
@@ -292,13 +327,13 @@ async def export_metadata(
         )
     
     elif request.format == "excel":
-        excel_file = export_service.create_excel(metadata_list)
-        return StreamingResponse(
-            excel_file,
+        # Written in constant-memory mode to a temp file, which is removed once sent
+        excel_path = await run_in_threadpool(export_service.create_excel_file, metadata_list)
+        return FileResponse(
+            excel_path,
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={
-                "Content-Disposition": f"attachment; filename=isrc_meta_data_export_{datetime.now().strftime('%Y%m%d')}.xlsx"
-            }
+            filename=f"isrc_meta_data_export_{datetime.now().strftime('%Y%m%d')}.xlsx",
+            background=BackgroundTask(os.unlink, excel_path)
         )
     
     elif request.format == "json":
@@ -335,8 +370,7 @@ async def get_track_metadata(
     if db_manager and not refresh:
         session = db_manager.get_session()
         try:
-            from src.models.database import Track
-            track = session.query(Track).filter(Track.isrc == isrc).first()
+            track = session.execute(_GET_TRACK, {"isrc": isrc}).scalar_one_or_none()
             if track:
                 return {
                     "isrc": track.isrc,
@@ -377,8 +411,6 @@ async def search_tracks(
     
     session = db_manager.get_session()
     try:
-        from src.models.database import Track
-        
         query = session.query(Track)
         
         # Apply search filters
@@ -436,25 +468,13 @@ async def get_statistics(app_state: dict[str, Any] = Depends(get_app_state)):
     
     session = db_manager.get_session()
     try:
-        from src.models.database import Track, TrackLyrics
-        
-        # Basic counts
-        total_tracks = session.query(Track).count()
-        
-        # Platform coverage
-        spotify_count = session.query(Track).filter(Track.spotify_id.isnot(None)).count()
-        youtube_count = session.query(Track).filter(Track.youtube_video_id.isnot(None)).count()
-        musicbrainz_count = session.query(Track).filter(Track.musicbrainz_recording_id.isnot(None)).count()
-        lyrics_count = session.query(TrackLyrics).count()
-        
-        # Calculate averages
-        tracks = session.query(Track).all()
-        if tracks:
-            avg_confidence = sum(t.confidence_score or 0 for t in tracks) / len(tracks)
-            avg_completeness = sum(t.data_completeness or 0 for t in tracks) / len(tracks)
-        else:
-            avg_confidence = 0
-            avg_completeness = 0
+        # Counts, coverage and averages in a single aggregate query
+        (
+            total_tracks, spotify_count, youtube_count, musicbrainz_count,
+            avg_confidence, avg_completeness, lyrics_count
+        ) = session.execute(_TRACK_STATS).one()
+        avg_confidence = avg_confidence or 0
+        avg_completeness = avg_completeness or 0
         
         # Database size (approximate)
         import os
@@ -560,7 +580,7 @@ async def clear_cache_for_isrc(
     if db_manager:
         session = db_manager.get_session()
         try:
-            from src.models.database import Track, TrackLyrics, TrackCredit
+            from src.models.database import TrackCredit
             
             # Delete related records
             session.query(TrackCredit).filter(TrackCredit.isrc == isrc).delete()
@@ -649,8 +669,6 @@ async def get_track_lyrics(
     
     session = db_manager.get_session()
     try:
-        from src.models.database import TrackLyrics
-        
         lyrics = session.query(TrackLyrics).filter(TrackLyrics.isrc == isrc).first()
         
         if not lyrics:
@@ -7,16 +7,79 @@ Fixed Discogs OAuth authentication
 import base64
 import hashlib
 import logging
+import re
 import time
 import requests
 import asyncio
-from datetime import datetime, timedelta
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from threading import Lock
 from typing import Any  # Still need Any from typing
-from urllib.parse import quote
+from urllib.parse import quote, urlsplit
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# HTTP/2 lets concurrent requests to one provider share a single connection
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Timeout for lazily created async clients (a shared client is normally injected)
+DEFAULT_ASYNC_TIMEOUT = 15.0
+
+# Connection pool for the shared async client; idle connections stay open for reuse
+HTTP_MAX_CONNECTIONS = 256
+HTTP_MAX_KEEPALIVE = 64
+HTTP_KEEPALIVE_EXPIRY = 30.0
+
+# Upper bound on startup prewarming so an unreachable provider cannot delay boot
+WARMUP_TIMEOUT = 5.0
+
+
+def parse_json(response: requests.Response | httpx.Response) -> Any:
+    """Decode a response body, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def create_http_client(timeout: float = DEFAULT_ASYNC_TIMEOUT) -> httpx.AsyncClient:
+    """Create the pooled keep-alive async client shared by every provider"""
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+        ),
+        timeout=timeout
+    )
+
+
+def create_session() -> requests.Session:
+    """Create a pooled requests session that retries transient server errors"""
+    # 429 is left to each client, which honours the provider's Retry-After itself
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 class RateLimiter:
     """Thread-safe rate limiter"""
@@ -43,59 +106,188 @@ class RateLimiter:
             self.request_times.append(now)
 
 
-class SpotifyClient:
+class AsyncTokenBucket:
+    """Token-bucket limiter for coroutines sharing one event loop"""
+    
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+    
+    async def acquire(self) -> None:
+        """Take one token, sleeping until it is available"""
+        # Refill and reserve without awaiting, so concurrent callers queue up in order
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+# Sustained provider limits in requests/second, run slightly under to absorb clock skew
+HOST_RATE_LIMITS = {
+    "api.spotify.com": 10,
+    "www.googleapis.com": 5,
+    "musicbrainz.org": 1,
+    "ws.audioscrobbler.com": 5,
+    "api.discogs.com": 1,
+    "api.genius.com": 5,
+}
+RATE_LIMIT_SAFETY = 0.95
+MAX_RATE_LIMIT_RETRIES = 3
+
+_host_limiters: dict[str, AsyncTokenBucket] = {}
+
+
+def get_host_limiter(host: str) -> AsyncTokenBucket:
+    """Return the process-wide token bucket for an API host"""
+    limiter = _host_limiters.get(host)
+    if limiter is None:
+        rate = HOST_RATE_LIMITS.get(host, 10) * RATE_LIMIT_SAFETY
+        limiter = _host_limiters[host] = AsyncTokenBucket(rate, capacity=max(1.0, rate))
+    return limiter
+
+
+def set_host_rate_limit(host: str, requests_per_second: float) -> None:
+    """Pace a host at a client-specific rate, e.g. the lower unauthenticated limit"""
+    rate = requests_per_second * RATE_LIMIT_SAFETY
+    limiter = get_host_limiter(host)
+    limiter.rate = rate
+    limiter.capacity = max(1.0, rate)
+    limiter._tokens = min(limiter._tokens, limiter.capacity)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait after a 429: Retry-After when given, else exponential backoff"""
+    retry_after = response.headers.get("Retry-After")
+    try:
+        return max(0.0, float(retry_after))
+    except (TypeError, ValueError):
+        return 0.5 * (2 ** attempt)
+
+
+async def limited_get(client: httpx.AsyncClient, host: str, url: str, **kwargs: Any) -> httpx.Response:
+    """GET through the host's token bucket, backing off on 429 responses"""
+    limiter = get_host_limiter(host)
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        await limiter.acquire()
+        response = await client.get(url, **kwargs)
+        if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+            return response
+        delay = _retry_delay(response, attempt)
+        logger.warning(f"{host} rate limited, waiting {delay:.1f} seconds")
+        await asyncio.sleep(delay)
+    return response
+
+
+class AsyncHTTPMixin:
+    """Shared httpx.AsyncClient access for the async client methods"""
+    
+    http_client: httpx.AsyncClient | None = None
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the injected client, creating a private one on first use"""
+        if self.http_client is None:
+            self.http_client = create_http_client()
+        return self.http_client
+    
+    async def _limited_get(self, host: str, url: str, **kwargs: Any) -> httpx.Response:
+        """GET through the host's token bucket, backing off on 429 responses"""
+        return await limited_get(self._get_http_client(), host, url, **kwargs)
+
+
+class SpotifyClient(AsyncHTTPMixin):
     """Spotify Web API client with full functionality"""
     
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(self, client_id: str, client_secret: str, http_client: httpx.AsyncClient | None = None):
         self.client_id = client_id
         self.client_secret = client_secret
+        self.http_client = http_client
         self.access_token: str | None = None
-        self.token_expires: datetime | None = None
+        self.token_expires_at = 0.0  # time.monotonic() deadline, refreshed 60s early
+        self._token_lock = asyncio.Lock()
         self.rate_limiter = RateLimiter(100)  # Spotify allows ~180 req/min
         self.base_url = "https://api.spotify.com/v1"
+        self.session = create_session()
+        self.token_url = "https://accounts.spotify.com/api/token"
     
     def _get_access_token(self) -> str:
         """Get or refresh access token"""
         # Check if we have a valid token
-        if self.access_token and self.token_expires and datetime.now() < self.token_expires:
+        if self._token_valid():
             return self.access_token
         
         # Get new token
-        auth_string = f"{self.client_id}:{self.client_secret}"
-        auth_bytes = auth_string.encode("utf-8")
-        auth_b64 = base64.b64encode(auth_bytes).decode("utf-8")
-        
-        headers = {
-            "Authorization": f"Basic {auth_b64}",
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-        
-        data = {"grant_type": "client_credentials"}
-        
         try:
-            response = requests.post(
-                "https://accounts.spotify.com/api/token",
-                headers=headers,
-                data=data,
+            response = self.session.post(
+                self.token_url,
+                headers=self._token_headers(),
+                data={"grant_type": "client_credentials"},
                 timeout=10
             )
             
             if response.status_code != 200:
                 raise Exception(f"Spotify auth failed: {response.status_code}")
             
-            token_data = response.json()
-            access_token = token_data["access_token"]
-            self.access_token = access_token
-            expires_in = token_data.get("expires_in", 3600)
-            self.token_expires = datetime.now() + timedelta(seconds=expires_in - 60)
-
-            logger.info("✅ Spotify token obtained successfully")
-            return access_token
+            return self._store_token(parse_json(response))
             
         except Exception as e:
             logger.error(f"Failed to get Spotify token: {e}")
             raise
     
+    async def _get_access_token_async(self) -> str:
+        """Async version of _get_access_token"""
+        # Fast path: no lock while the cached token is valid
+        if self._token_valid():
+            return self.access_token
+        
+        async with self._token_lock:
+            # Another coroutine may have refreshed while we waited
+            if self._token_valid():
+                return self.access_token
+            
+            try:
+                response = await self._get_http_client().post(
+                    self.token_url,
+                    headers=self._token_headers(),
+                    data={"grant_type": "client_credentials"},
+                    timeout=10
+                )
+                
+                if response.status_code != 200:
+                    raise Exception(f"Spotify auth failed: {response.status_code}")
+                
+                return self._store_token(parse_json(response))
+                
+            except Exception as e:
+                logger.error(f"Failed to get Spotify token: {e}")
+                raise
+    
+    def _token_valid(self) -> bool:
+        """Check whether the cached token can still be used"""
+        return bool(self.access_token) and time.monotonic() < self.token_expires_at
+    
+    def _token_headers(self) -> dict[str, str]:
+        """Client-credentials headers for the token endpoint"""
+        auth_string = f"{self.client_id}:{self.client_secret}"
+        auth_b64 = base64.b64encode(auth_string.encode("utf-8")).decode("utf-8")
+        return {
+            "Authorization": f"Basic {auth_b64}",
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+    
+    def _store_token(self, token_data: dict[str, Any]) -> str:
+        """Remember a freshly issued token and its expiry"""
+        access_token = token_data["access_token"]
+        self.access_token = access_token
+        expires_in = token_data.get("expires_in", 3600)
+        self.token_expires_at = time.monotonic() + expires_in - 60
+        
+        logger.info("✅ Spotify token obtained successfully")
+        return access_token
+    
     def _make_request(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
         """Make authenticated API request"""
         self.rate_limiter.wait_if_needed()
@@ -108,7 +300,7 @@ class SpotifyClient:
         url = f"{self.base_url}{endpoint}"
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.session.get(url, headers=headers, params=params, timeout=10)
             
             # Handle rate limiting
             if response.status_code == 429:
@@ -124,56 +316,94 @@ class SpotifyClient:
                 logger.error(f"Spotify API error: {response.status_code} - {response.text}")
                 return None
             
-            return response.json()
+            return parse_json(response)
             
         except Exception as e:
             logger.error(f"Spotify request failed: {e}")
             return None
     
-    def search_by_isrc(self, isrc: str) -> dict[str, Any] | None:
-        """Search for track by ISRC"""
-        params = {
+    async def _make_request_async(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """Async version of _make_request"""
+        headers = {
+            "Authorization": f"Bearer {await self._get_access_token_async()}",
+            "Content-Type": "application/json"
+        }
+        
+        url = f"{self.base_url}{endpoint}"
+        
+        try:
+            response = await self._limited_get(
+                "api.spotify.com", url, headers=headers, params=params, timeout=10
+            )
+            
+            if response.status_code == 404:
+                return None  # Not found is not an error
+            
+            if response.status_code != 200:
+                logger.error(f"Spotify API error: {response.status_code} - {response.text}")
+                return None
+            
+            return parse_json(response)
+            
+        except Exception as e:
+            logger.error(f"Spotify request failed: {e}")
+            return None
+    
+    @staticmethod
+    def _isrc_search_params(isrc: str) -> dict[str, Any]:
+        """Search parameters for an ISRC lookup"""
+        return {
             "q": f"isrc:{isrc}",
             "type": "track",
             "limit": 1
         }
-        
-        result = self._make_request("/search", params)
-        
+    
+    @staticmethod
+    def _first_track(result: dict[str, Any] | None) -> dict[str, Any] | None:
+        """First track item from a search response"""
         if result and result.get("tracks", {}).get("items"):
             return result["tracks"]["items"][0]
-        
         return None
     
+    def search_by_isrc(self, isrc: str) -> dict[str, Any] | None:
+        """Search for track by ISRC"""
+        return self._first_track(self._make_request("/search", self._isrc_search_params(isrc)))
+    
+    async def search_by_isrc_async(self, isrc: str) -> dict[str, Any] | None:
+        """Async version of search_by_isrc"""
+        return self._first_track(await self._make_request_async("/search", self._isrc_search_params(isrc)))
+    
     def get_audio_features(self, track_id: str) -> dict[str, Any] | None:
         """Get audio features for a track"""
         return self._make_request(f"/audio-features/{track_id}")
     
+    async def get_audio_features_async(self, track_id: str) -> dict[str, Any] | None:
+        """Async version of get_audio_features"""
+        return await self._make_request_async(f"/audio-features/{track_id}")
+    
     def get_track(self, track_id: str) -> dict[str, Any] | None:
         """Get detailed track information"""
         return self._make_request(f"/tracks/{track_id}")
 
 
-class YouTubeClient:
+class YouTubeClient(AsyncHTTPMixin):
     """YouTube Data API v3 client"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: httpx.AsyncClient | None = None):
         self.api_key = api_key
         self.base_url = "https://www.googleapis.com/youtube/v3"
+        self.session = create_session()
         self.rate_limiter = RateLimiter(100)  # Conservative rate limiting
+        self.http_client = http_client
     
-    def search_by_isrc(self, isrc: str, track_title: str | None = None, 
-                      artist: str | None = None) -> dict[str, Any] | None:
-        """Search for music video by ISRC"""
-        self.rate_limiter.wait_if_needed()
-        
-        # Build search query
+    def _search_params(self, isrc: str, track_title: str | None, artist: str | None) -> dict[str, Any]:
+        """Build search parameters, preferring an artist/title query"""
         if track_title and artist:
             query = f'"{artist}" "{track_title}"'
         else:
             query = f'"{isrc}"'
         
-        params = {
+        return {
             "part": "snippet",
             "q": query,
             "type": "video",
@@ -181,29 +411,41 @@ class YouTubeClient:
             "maxResults": 5,
             "key": self.api_key
         }
+    
+    @staticmethod
+    def _pick_video_id(data: dict[str, Any], isrc: str) -> str | None:
+        """Pick the video mentioning the ISRC, else the first result"""
+        items = data.get("items")
+        if not items:
+            return None
+        
+        # Look for ISRC in video descriptions without copying each one upper-cased
+        isrc_pattern = re.compile(re.escape(isrc), re.IGNORECASE)
+        for item in items:
+            description = item.get("snippet", {}).get("description", "")
+            if isrc_pattern.search(description):
+                return item["id"]["videoId"]
+        
+        # If no exact match, return first result
+        return items[0]["id"]["videoId"]
+    
+    def search_by_isrc(self, isrc: str, track_title: str | None = None, 
+                      artist: str | None = None) -> dict[str, Any] | None:
+        """Search for music video by ISRC"""
+        self.rate_limiter.wait_if_needed()
+        
+        params = self._search_params(isrc, track_title, artist)
         
         try:
-            response = requests.get(f"{self.base_url}/search", params=params, timeout=10)
+            response = self.session.get(f"{self.base_url}/search", params=params, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"YouTube search failed: {response.status_code}")
                 return None
             
-            data = response.json()
-            
-            # Look for ISRC in video descriptions
-            if data.get("items"):
-                for item in data["items"]:
-                    snippet = item.get("snippet", {})
-                    description = snippet.get("description", "").upper()
-                    
-                    # Check if ISRC is mentioned in description
-                    if isrc in description:
-                        return self._get_video_details(item["id"]["videoId"])
-                
-                # If no exact match, return first result
-                if data["items"]:
-                    return self._get_video_details(data["items"][0]["id"]["videoId"])
+            video_id = self._pick_video_id(parse_json(response), isrc)
+            if video_id:
+                return self._get_video_details(video_id)
             
             return None
             
@@ -211,21 +453,65 @@ class YouTubeClient:
             logger.error(f"YouTube search error: {e}")
             return None
     
-    def _get_video_details(self, video_id: str) -> dict[str, Any] | None:
-        """Get detailed video information including statistics"""
-        self.rate_limiter.wait_if_needed()
+    async def search_by_isrc_async(self, isrc: str, track_title: str | None = None,
+                                   artist: str | None = None) -> dict[str, Any] | None:
+        """Async version of search_by_isrc"""
+        params = self._search_params(isrc, track_title, artist)
         
-        params = {
+        try:
+            response = await self._limited_get(
+                "www.googleapis.com", f"{self.base_url}/search", params=params, timeout=10
+            )
+            
+            if response.status_code != 200:
+                logger.error(f"YouTube search failed: {response.status_code}")
+                return None
+            
+            video_id = self._pick_video_id(parse_json(response), isrc)
+            if video_id:
+                return await self._get_video_details_async(video_id)
+            
+            return None
+            
+        except Exception as e:
+            logger.error(f"YouTube search error: {e}")
+            return None
+    
+    def _video_params(self, video_id: str) -> dict[str, Any]:
+        """Parameters for a videos.list call"""
+        return {
             "part": "snippet,statistics,contentDetails",
             "id": video_id,
             "key": self.api_key
         }
+    
+    def _get_video_details(self, video_id: str) -> dict[str, Any] | None:
+        """Get detailed video information including statistics"""
+        self.rate_limiter.wait_if_needed()
         
         try:
-            response = requests.get(f"{self.base_url}/videos", params=params, timeout=10)
+            response = self.session.get(f"{self.base_url}/videos", params=self._video_params(video_id), timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
+                if data.get("items"):
+                    return data["items"][0]
+            
+            return None
+            
+        except Exception as e:
+            logger.error(f"YouTube video details error: {e}")
+            return None
+    
+    async def _get_video_details_async(self, video_id: str) -> dict[str, Any] | None:
+        """Async version of _get_video_details"""
+        try:
+            response = await self._limited_get(
+                "www.googleapis.com", f"{self.base_url}/videos", params=self._video_params(video_id), timeout=10
+            )
+            
+            if response.status_code == 200:
+                data = parse_json(response)
                 if data.get("items"):
                     return data["items"][0]
             
@@ -236,34 +522,71 @@ class YouTubeClient:
             return None
 
 
-class MusicBrainzClient:
+class MusicBrainzClient(AsyncHTTPMixin):
     """MusicBrainz API client"""
     
-    def __init__(self):
+    def __init__(self, http_client: httpx.AsyncClient | None = None):
+        self.http_client = http_client
         self.base_url = "https://musicbrainz.org/ws/2"
+        self.session = create_session()
         self.rate_limiter = RateLimiter(50)  # MusicBrainz: 1 req/sec avg
         self.headers = {
             "User-Agent": "PRISM-Analytics/2.0 (https://precise.digital)"
         }
+        # Sent on every sync request; async calls pass them since the httpx client is shared
+        self.session.headers.update(self.headers)
     
-    def search_recording_by_isrc(self, isrc: str) -> dict[str, Any] | None:
-        """Search for recording by ISRC"""
-        self.rate_limiter.wait_if_needed()
-        
-        params = {
+    @staticmethod
+    def _isrc_search_params(isrc: str) -> dict[str, Any]:
+        """Search parameters for an ISRC lookup"""
+        return {
             "query": f"isrc:{isrc}",
             "fmt": "json",
             "inc": "artist-credits+releases+isrcs"
         }
-        
+    
+    async def search_recording_by_isrc_async(self, isrc: str) -> dict[str, Any] | None:
+        """Async version of search_recording_by_isrc"""
         try:
-            response = requests.get(
+            response = await self._limited_get(
+                "musicbrainz.org",
                 f"{self.base_url}/recording/",
-                params=params,
+                params=self._isrc_search_params(isrc),
                 headers=self.headers,
                 timeout=15
             )
             
+            if response.status_code == 503:
+                logger.warning("MusicBrainz service temporarily unavailable")
+                await asyncio.sleep(2)
+                return None
+            
+            if response.status_code != 200:
+                logger.error(f"MusicBrainz error: {response.status_code}")
+                return None
+            
+            data = parse_json(response)
+            
+            if data.get("recordings"):
+                return data["recordings"][0]
+            
+            return None
+            
+        except Exception as e:
+            logger.error(f"MusicBrainz request error: {e}")
+            return None
+    
+    def search_recording_by_isrc(self, isrc: str) -> dict[str, Any] | None:
+        """Search for recording by ISRC"""
+        self.rate_limiter.wait_if_needed()
+        
+        try:
+            response = self.session.get(
+                f"{self.base_url}/recording/",
+                params=self._isrc_search_params(isrc),
+                timeout=15
+            )
+            
             if response.status_code == 503:
                 logger.warning("MusicBrainz service temporarily unavailable")
                 time.sleep(2)
@@ -273,7 +596,7 @@ class MusicBrainzClient:
                 logger.error(f"MusicBrainz error: {response.status_code}")
                 return None
             
-            data = response.json()
+            data = parse_json(response)
             
             if data.get("recordings"):
                 return data["recordings"][0]
@@ -294,15 +617,14 @@ class MusicBrainzClient:
         }
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/recording/{recording_id}",
                 params=params,
-                headers=self.headers,
                 timeout=15
             )
             
             if response.status_code == 200:
-                return response.json()
+                return parse_json(response)
             
             return None
             
@@ -311,16 +633,25 @@ class MusicBrainzClient:
             return None
 
 
-class GeniusClient:
+class GeniusClient(AsyncHTTPMixin):
     """Genius API client for lyrics and credits"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: httpx.AsyncClient | None = None):
         self.api_key = api_key
         self.base_url = "https://api.genius.com"
+        self.session = create_session()
         self.rate_limiter = RateLimiter(100)
+        self.http_client = http_client
         self.headers = {
             "Authorization": f"Bearer {api_key}"
         }
+        self.session.headers.update(self.headers)
+    
+    @staticmethod
+    def _first_hit(data: dict[str, Any]) -> dict[str, Any] | None:
+        """Most relevant song from a search response"""
+        hits = data.get("response", {}).get("hits", [])
+        return hits[0]["result"] if hits else None
     
     def search_song(self, title: str, artist: str) -> dict[str, Any] | None:
         """Search for a song on Genius"""
@@ -331,9 +662,8 @@ class GeniusClient:
         }
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/search",
-                headers=self.headers,
                 params=params,
                 timeout=10
             )
@@ -342,14 +672,25 @@ class GeniusClient:
                 logger.error(f"Genius search failed: {response.status_code}")
                 return None
             
-            data = response.json()
-            hits = data.get("response", {}).get("hits", [])
-            
-            if hits:
-                # Return the most relevant result
-                return hits[0]["result"]
+            return self._first_hit(parse_json(response))
             
+        except Exception as e:
+            logger.error(f"Genius search error: {e}")
             return None
+    
+    async def search_song_async(self, title: str, artist: str) -> dict[str, Any] | None:
+        """Async version of search_song"""
+        try:
+            response = await self._limited_get(
+                "api.genius.com", f"{self.base_url}/search",
+                headers=self.headers, params={"q": f"{title} {artist}"}, timeout=10
+            )
+            
+            if response.status_code != 200:
+                logger.error(f"Genius search failed: {response.status_code}")
+                return None
+            
+            return self._first_hit(parse_json(response))
             
         except Exception as e:
             logger.error(f"Genius search error: {e}")
@@ -360,14 +701,29 @@ class GeniusClient:
         self.rate_limiter.wait_if_needed()
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/songs/{song_id}",
-                headers=self.headers,
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()["response"]["song"]
+                return parse_json(response)["response"]["song"]
+            
+            return None
+            
+        except Exception as e:
+            logger.error(f"Genius song details error: {e}")
+            return None
+    
+    async def get_song_details_async(self, song_id: int) -> dict[str, Any] | None:
+        """Async version of get_song_details"""
+        try:
+            response = await self._limited_get(
+                "api.genius.com", f"{self.base_url}/songs/{song_id}", headers=self.headers, timeout=10
+            )
+            
+            if response.status_code == 200:
+                return parse_json(response)["response"]["song"]
             
             return None
             
@@ -376,27 +732,46 @@ class GeniusClient:
             return None
 
 
-class LastFmClient:
+class LastFmClient(AsyncHTTPMixin):
     """Last.fm API client for music metadata and social listening data"""
     
-    def __init__(self, api_key: str, shared_secret: str):
+    def __init__(self, api_key: str, shared_secret: str, http_client: httpx.AsyncClient | None = None):
         self.api_key = api_key
         self.shared_secret = shared_secret
         self.base_url = "http://ws.audioscrobbler.com/2.0/"
+        self.session = create_session()
         self.rate_limiter = RateLimiter(60)
+        self.http_client = http_client
+    
+    def _request_params(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Add API key and format to a request's parameters"""
+        params['api_key'] = self.api_key
+        params['format'] = 'json'
+        return params
+    
+    @staticmethod
+    def _parse_response(response: requests.Response | httpx.Response) -> dict[str, Any] | None:
+        """Decode a Last.fm response, treating API-level errors as misses"""
+        if response.status_code != 200:
+            logger.error(f"Last.fm API error: {response.status_code} - {response.text}")
+            return None
+        
+        data = parse_json(response)
+        
+        if 'error' in data:
+            logger.error(f"Last.fm API error: {data.get('message', 'Unknown error')}")
+            return None
+        
+        return data
     
     def _make_request(self, params: dict[str, Any]) -> dict[str, Any] | None:
         """Make a request to Last.fm API"""
         self.rate_limiter.wait_if_needed()
         
-        # Add API key and format to all requests
-        params['api_key'] = self.api_key
-        params['format'] = 'json'
-        
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.base_url,
-                params=params,
+                params=self._request_params(params),
                 timeout=10
             )
             
@@ -405,33 +780,47 @@ class LastFmClient:
                 time.sleep(60)
                 return self._make_request(params)
             
-            if response.status_code != 200:
-                logger.error(f"Last.fm API error: {response.status_code} - {response.text}")
-                return None
+            return self._parse_response(response)
             
-            data = response.json()
-            
-            if 'error' in data:
-                logger.error(f"Last.fm API error: {data.get('message', 'Unknown error')}")
-                return None
-            
-            return data
+        except Exception as e:
+            logger.error(f"Last.fm request failed: {e}")
+            return None
+    
+    async def _make_request_async(self, params: dict[str, Any]) -> dict[str, Any] | None:
+        """Async version of _make_request"""
+        try:
+            response = await self._limited_get(
+                "ws.audioscrobbler.com", self.base_url, params=self._request_params(params), timeout=10
+            )
+            return self._parse_response(response)
             
         except Exception as e:
             logger.error(f"Last.fm request failed: {e}")
             return None
     
-    def search_track(self, title: str, artist: str, limit: int = 5) -> dict[str, Any] | None:
-        """Search for a track on Last.fm"""
-        params = {
+    @staticmethod
+    def _track_params(method: str, artist: str, track: str) -> dict[str, Any]:
+        """Parameters for the track.* lookup methods"""
+        return {
+            'method': method,
+            'artist': artist,
+            'track': track,
+            'autocorrect': '1'
+        }
+    
+    @staticmethod
+    def _search_track_params(title: str, artist: str, limit: int) -> dict[str, Any]:
+        """Parameters for track.search"""
+        return {
             'method': 'track.search',
             'track': title,
             'artist': artist,
             'limit': limit
         }
-        
-        result = self._make_request(params)
-        
+    
+    @staticmethod
+    def _first_search_match(result: dict[str, Any] | None) -> dict[str, Any] | None:
+        """First track from a track.search response"""
         if result and 'results' in result:
             tracks = result['results'].get('trackmatches', {}).get('track', [])
             if tracks:
@@ -442,40 +831,58 @@ class LastFmClient:
         
         return None
     
-    def get_track_info(self, artist: str, track: str, username: str | None = None) -> dict[str, Any] | None:
-        """Get detailed track information including play count and listeners"""
-        params = {
-            'method': 'track.getInfo',
+    @staticmethod
+    def _album_params(artist: str, album: str) -> dict[str, Any]:
+        """Parameters for album.getInfo"""
+        return {
+            'method': 'album.getInfo',
             'artist': artist,
-            'track': track,
+            'album': album,
             'autocorrect': '1'
         }
+    
+    @staticmethod
+    def _pluck(result: dict[str, Any] | None, key: str) -> dict[str, Any] | None:
+        """Top-level object of a response, if present"""
+        if result and key in result:
+            return result[key]
+        return None
+    
+    @staticmethod
+    def _tags(result: dict[str, Any] | None) -> list[dict[str, Any]] | None:
+        """Tag list from a track.getTopTags response"""
+        if result and 'toptags' in result:
+            return result['toptags'].get('tag', [])
+        return None
+    
+    def search_track(self, title: str, artist: str, limit: int = 5) -> dict[str, Any] | None:
+        """Search for a track on Last.fm"""
+        return self._first_search_match(self._make_request(self._search_track_params(title, artist, limit)))
+    
+    async def search_track_async(self, title: str, artist: str, limit: int = 5) -> dict[str, Any] | None:
+        """Async version of search_track"""
+        return self._first_search_match(await self._make_request_async(self._search_track_params(title, artist, limit)))
+    
+    def get_track_info(self, artist: str, track: str, username: str | None = None) -> dict[str, Any] | None:
+        """Get detailed track information including play count and listeners"""
+        params = self._track_params('track.getInfo', artist, track)
         
         if username:
             params['username'] = username
         
-        result = self._make_request(params)
-        
-        if result and 'track' in result:
-            return result['track']
-        
-        return None
+        return self._pluck(self._make_request(params), 'track')
+    
+    async def get_track_info_async(self, artist: str, track: str) -> dict[str, Any] | None:
+        """Async version of get_track_info"""
+        return self._pluck(await self._make_request_async(self._track_params('track.getInfo', artist, track)), 'track')
     
     def get_track_tags(self, artist: str, track: str) -> list[dict[str, Any]] | None:
         """Get top tags for a track"""
-        params = {
-            'method': 'track.getTopTags',
-            'artist': artist,
-            'track': track,
-            'autocorrect': '1'
-        }
-        
-        result = self._make_request(params)
-        
-        if result and 'toptags' in result:
-            return result['toptags'].get('tag', [])
-        
-        return None
+        return self._tags(self._make_request(self._track_params('track.getTopTags', artist, track)))
+    
+    async def get_track_tags_async(self, artist: str, track: str) -> list[dict[str, Any]] | None:
+        """Async version of get_track_tags"""
+        return self._tags(await self._make_request_async(self._track_params('track.getTopTags', artist, track)))
     
     def get_similar_tracks(self, artist: str, track: str, limit: int = 10) -> list[dict[str, Any]] | None:
         """Get similar tracks"""
@@ -511,19 +918,11 @@ class LastFmClient:
     
     def get_album_info(self, artist: str, album: str) -> dict[str, Any] | None:
         """Get detailed album information"""
-        params = {
-            'method': 'album.getInfo',
-            'artist': artist,
-            'album': album,
-            'autocorrect': '1'
-        }
-        
-        result = self._make_request(params)
-        
-        if result and 'album' in result:
-            return result['album']
-        
-        return None
+        return self._pluck(self._make_request(self._album_params(artist, album)), 'album')
+    
+    async def get_album_info_async(self, artist: str, album: str) -> dict[str, Any] | None:
+        """Async version of get_album_info"""
+        return self._pluck(await self._make_request_async(self._album_params(artist, album)), 'album')
     
     def search_by_mbid(self, mbid: str) -> dict[str, Any] | None:
         """Search for a track by MusicBrainz ID"""
@@ -554,11 +953,11 @@ class LastFmClient:
         return None
 
 
-class DiscogsClient:
+class DiscogsClient(AsyncHTTPMixin):
     """Discogs API client with OAuth authentication"""
     
     def __init__(self, consumer_key: str | None = None, consumer_secret: str | None = None, 
-                 user_token: str | None = None):
+                 user_token: str | None = None, http_client: httpx.AsyncClient | None = None):
         """
         Initialize Discogs client with OAuth credentials
         
@@ -566,11 +965,14 @@ class DiscogsClient:
             consumer_key: Your Discogs Consumer Key (from app settings)
             consumer_secret: Your Discogs Consumer Secret (from app settings)
             user_token: Optional personal access token for authenticated requests
+            http_client: Shared async HTTP client for the *_async methods
         """
         self.consumer_key = consumer_key
         self.consumer_secret = consumer_secret
         self.user_token = user_token
         self.base_url = "https://api.discogs.com"
+        self.session = create_session()
+        self.http_client = http_client
         self.rate_limiter = RateLimiter(60)  # Discogs allows 60 requests per minute with auth
         
         # Set up headers
@@ -596,14 +998,13 @@ class DiscogsClient:
             self.auth_params = {}
             self.rate_limiter = RateLimiter(25)  # Lower rate limit without auth
             logger.warning("⚠️ Discogs client initialized without authentication (limited to 25 req/min)")
-    
-    def _make_request(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
-        """Make a request to Discogs API with proper authentication"""
-        self.rate_limiter.wait_if_needed()
         
-        url = f"{self.base_url}{endpoint}"
-        
-        # Merge authentication params with request params
+        self.session.headers.update(self.headers)
+        # The async path shares one token bucket per host, so it follows the auth state too
+        set_host_rate_limit("api.discogs.com", self.rate_limiter.requests_per_minute / 60)
+    
+    def _request_params(self, params: dict[str, Any] | None) -> dict[str, Any]:
+        """Merge authentication params with request params"""
         if params is None:
             params = {}
         
@@ -611,18 +1012,50 @@ class DiscogsClient:
         if self.auth_params:
             params.update(self.auth_params)
         
+        return params
+    
+    @staticmethod
+    def _rate_limit_low(response: requests.Response | httpx.Response) -> bool:
+        """Whether the rate limit headers say to slow down"""
+        remaining = response.headers.get('X-Discogs-Ratelimit-Remaining')
+        if remaining and int(remaining) < 5:
+            logger.warning(f"Discogs rate limit low: {remaining} requests remaining")
+            return True
+        return False
+    
+    @staticmethod
+    def _parse_response(response: requests.Response | httpx.Response) -> dict[str, Any] | None:
+        """Decode a Discogs response; 404 is a miss rather than an error"""
+        if response.status_code == 401:
+            logger.error(f"Discogs authentication failed. Check your Consumer Key and Secret.")
+            logger.error(f"Response: {response.text}")
+            return None
+        
+        if response.status_code == 404:
+            return None  # Not found is not an error
+        
+        if response.status_code != 200:
+            logger.error(f"Discogs API error: {response.status_code} - {response.text}")
+            return None
+        
+        return parse_json(response)
+    
+    def _make_request(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """Make a request to Discogs API with proper authentication"""
+        self.rate_limiter.wait_if_needed()
+        
+        url = f"{self.base_url}{endpoint}"
+        params = self._request_params(params)
+        
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
-                headers=self.headers,
                 params=params,
                 timeout=15
             )
             
             # Check rate limit headers
-            remaining = response.headers.get('X-Discogs-Ratelimit-Remaining')
-            if remaining and int(remaining) < 5:
-                logger.warning(f"Discogs rate limit low: {remaining} requests remaining")
+            if self._rate_limit_low(response):
                 time.sleep(1)  # Add a small delay
             
             if response.status_code == 429:
@@ -632,24 +1065,35 @@ class DiscogsClient:
                 time.sleep(retry_after)
                 return self._make_request(endpoint, params)
             
-            if response.status_code == 401:
-                logger.error(f"Discogs authentication failed. Check your Consumer Key and Secret.")
-                logger.error(f"Response: {response.text}")
-                return None
+            return self._parse_response(response)
             
-            if response.status_code == 404:
-                return None  # Not found is not an error
+        except requests.exceptions.Timeout:
+            logger.error("Discogs request timed out")
+            return None
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Discogs request failed: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error in Discogs request: {e}")
+            return None
+    
+    async def _make_request_async(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """Async version of _make_request; 429 backoff happens in _limited_get"""
+        try:
+            response = await self._limited_get(
+                "api.discogs.com", f"{self.base_url}{endpoint}",
+                headers=self.headers, params=self._request_params(params), timeout=15
+            )
             
-            if response.status_code != 200:
-                logger.error(f"Discogs API error: {response.status_code} - {response.text}")
-                return None
+            if self._rate_limit_low(response):
+                await asyncio.sleep(1)
             
-            return response.json()
+            return self._parse_response(response)
             
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             logger.error("Discogs request timed out")
             return None
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Discogs request failed: {e}")
             return None
         except Exception as e:
@@ -709,15 +1153,23 @@ class DiscogsClient:
         
         return self._make_request("/database/search", params)
     
-    def search_release(self, title: str, artist: str, type: str = "release") -> dict[str, Any] | None:
-        """Search for a release on Discogs"""
-        result = self.search(title=title, artist=artist, type=type, per_page=10)
-        
+    @staticmethod
+    def _first_result(result: dict[str, Any] | None) -> dict[str, Any] | None:
+        """First hit of a database search"""
         if result and 'results' in result and result['results']:
             return result['results'][0]
         
         return None
     
+    def search_release(self, title: str, artist: str, type: str = "release") -> dict[str, Any] | None:
+        """Search for a release on Discogs"""
+        return self._first_result(self.search(title=title, artist=artist, type=type, per_page=10))
+    
+    async def search_release_async(self, title: str, artist: str, type: str = "release") -> dict[str, Any] | None:
+        """Async version of search_release"""
+        params = {'type': type, 'title': title, 'artist': artist, 'per_page': 10}
+        return self._first_result(await self._make_request_async("/database/search", params))
+    
     def search_by_barcode(self, barcode: str) -> dict[str, Any] | None:
         """Search for a release by barcode/UPC"""
         result = self.search(barcode=barcode, type='release', per_page=10)
@@ -740,10 +1192,18 @@ class DiscogsClient:
         """Get detailed release information"""
         return self._make_request(f"/releases/{release_id}")
     
+    async def get_release_async(self, release_id: int) -> dict[str, Any] | None:
+        """Async version of get_release"""
+        return await self._make_request_async(f"/releases/{release_id}")
+    
     def get_master_release(self, master_id: int) -> dict[str, Any] | None:
         """Get master release information"""
         return self._make_request(f"/masters/{master_id}")
     
+    async def get_master_release_async(self, master_id: int) -> dict[str, Any] | None:
+        """Async version of get_master_release"""
+        return await self._make_request_async(f"/masters/{master_id}")
+    
     def get_release_versions(self, master_id: int) -> list[dict[str, Any]] | None:
         """Get all versions of a master release"""
         result = self._make_request(f"/masters/{master_id}/versions")
@@ -857,8 +1317,11 @@ class DiscogsClient:
 class APIClientManager:
     """Centralized API client manager"""
     
-    def __init__(self, config: dict[str, Any]):
+    def __init__(self, config: dict[str, Any], http_client: httpx.AsyncClient | None = None):
         self.config = config
+        # Shared async HTTP client for every provider; owned here only when not injected
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or create_http_client()
         self.spotify: SpotifyClient | None = None
         self.youtube: YouTubeClient | None = None
         self.musicbrainz: MusicBrainzClient | None = None
@@ -877,7 +1340,8 @@ class APIClientManager:
             try:
                 self.spotify = SpotifyClient(
                     self.config["SPOTIFY_CLIENT_ID"],
-                    self.config["SPOTIFY_CLIENT_SECRET"]
+                    self.config["SPOTIFY_CLIENT_SECRET"],
+                    http_client=self.http_client
                 )
                 logger.info("✅ Spotify client initialized")
             except Exception as e:
@@ -888,7 +1352,7 @@ class APIClientManager:
         # YouTube
         if self.config.get("YOUTUBE_API_KEY"):
             try:
-                self.youtube = YouTubeClient(self.config["YOUTUBE_API_KEY"])
+                self.youtube = YouTubeClient(self.config["YOUTUBE_API_KEY"], http_client=self.http_client)
                 logger.info("✅ YouTube client initialized")
             except Exception as e:
                 logger.error(f"Failed to initialize YouTube: {e}")
@@ -897,7 +1361,7 @@ class APIClientManager:
         
         # MusicBrainz (no auth required)
         try:
-            self.musicbrainz = MusicBrainzClient()
+            self.musicbrainz = MusicBrainzClient(http_client=self.http_client)
             logger.info("✅ MusicBrainz client initialized")
         except Exception as e:
             logger.error(f"Failed to initialize MusicBrainz: {e}")
@@ -905,7 +1369,7 @@ class APIClientManager:
         # Genius
         if self.config.get("GENIUS_API_KEY"):
             try:
-                self.genius = GeniusClient(self.config["GENIUS_API_KEY"])
+                self.genius = GeniusClient(self.config["GENIUS_API_KEY"], http_client=self.http_client)
                 logger.info("✅ Genius client initialized")
             except Exception as e:
                 logger.error(f"Failed to initialize Genius: {e}")
@@ -917,7 +1381,8 @@ class APIClientManager:
             try:
                 self.lastfm = LastFmClient(
                     self.config["LASTFM_API_KEY"],
-                    self.config["LASTFM_SHARED_SECRET"]
+                    self.config["LASTFM_SHARED_SECRET"],
+                    http_client=self.http_client
                 )
                 logger.info("✅ Last.fm client initialized")
             except Exception as e:
@@ -935,7 +1400,8 @@ class APIClientManager:
                 self.discogs = DiscogsClient(
                     consumer_key=discogs_consumer_key,
                     consumer_secret=discogs_consumer_secret,
-                    user_token=discogs_user_token  # Optional
+                    user_token=discogs_user_token,  # Optional
+                    http_client=self.http_client
                 )
                 logger.info("✅ Discogs client initialized with OAuth")
                 if discogs_user_token:
@@ -945,7 +1411,7 @@ class APIClientManager:
         elif discogs_user_token:
             # Fallback to token-only authentication
             try:
-                self.discogs = DiscogsClient(user_token=discogs_user_token)
+                self.discogs = DiscogsClient(user_token=discogs_user_token, http_client=self.http_client)
                 logger.info("✅ Discogs client initialized with User Token only")
             except Exception as e:
                 logger.error(f"Failed to initialize Discogs: {e}")
@@ -953,7 +1419,7 @@ class APIClientManager:
             logger.warning("⚠️ Discogs not configured - add CONSUMER_KEY and CONSUMER_SECRET")
             # Initialize without auth for very limited access
             try:
-                self.discogs = DiscogsClient()
+                self.discogs = DiscogsClient(http_client=self.http_client)
                 logger.warning("   Using unauthenticated access (25 req/min limit)")
             except Exception as e:
                 logger.error(f"Failed to initialize Discogs: {e}")
@@ -974,9 +1440,62 @@ class APIClientManager:
     
     async def validate_clients_async(self) -> dict[str, str]:
         """Async version of validate_clients"""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.validate_clients)
     
+    async def _warm_connection(self, name: str, base_url: str, timeout: float) -> bool:
+        """Open a pooled connection to a provider with a cheap HEAD request"""
+        host = urlsplit(base_url).hostname
+        try:
+            await get_host_limiter(host).acquire()
+            await self.http_client.head(base_url, timeout=timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ {name} warmup failed: {e}")
+            return False
+    
+    async def _warm_spotify_token(self) -> bool:
+        """Fetch the Spotify client-credentials token ahead of the first search"""
+        try:
+            await self.spotify._get_access_token_async()
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Spotify token warmup failed: {e}")
+            return False
+    
+    async def warmup(self, timeout: float = WARMUP_TIMEOUT) -> dict[str, bool]:
+        """Prefetch auth tokens and open provider connections before the first request"""
+        clients = {
+            "spotify": self.spotify,
+            "youtube": self.youtube,
+            "musicbrainz": self.musicbrainz,
+            "genius": self.genius,
+            "lastfm": self.lastfm,
+            "discogs": self.discogs
+        }
+        warmups = {
+            name: self._warm_connection(name, client.base_url, timeout)
+            for name, client in clients.items() if client
+        }
+        if self.spotify:
+            # The token request also opens the connection to accounts.spotify.com
+            warmups["spotify_token"] = self._warm_spotify_token()
+        
+        try:
+            results = await asyncio.wait_for(asyncio.gather(*warmups.values()), timeout)
+        except TimeoutError:
+            logger.warning(f"⚠️ API warmup timed out after {timeout:.0f}s")
+            return {name: False for name in warmups}
+        
+        status = dict(zip(warmups, results))
+        logger.info(f"🔥 API warmup: {sum(status.values())}/{len(status)} ready")
+        return status
+    
+    async def aclose(self) -> None:
+        """Close the shared async HTTP client if this manager created it"""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+    
     def get_available_clients(self) -> list[str]:
         """Get list of available client names"""
         available = []
@@ -1000,6 +1519,14 @@ class APIClientManager:
 # Export all clients
 __all__ = [
     'RateLimiter',
+    'create_http_client',
+    'create_session',
+    'parse_json',
+    'AsyncTokenBucket',
+    'AsyncHTTPMixin',
+    'get_host_limiter',
+    'set_host_rate_limit',
+    'limited_get',
     'SpotifyClient',
     'YouTubeClient',
     'MusicBrainzClient',
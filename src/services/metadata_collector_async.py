@@ -9,27 +9,51 @@ import logging
 import os
 import re
 import sys
+import time
 from datetime import datetime
 
 # Add path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
+from src.services.memory_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+_ISRC_RE = re.compile(r"[A-Z]{2}[A-Z0-9]{3}[0-9]{7}")
+_ISRC_STRIP_RE = re.compile(r"[-\s]")
+
+# ISRCs a bulk analysis keeps in flight; provider calls are paced per host by the API clients
+BULK_CONCURRENCY = int(os.getenv("BULK_CONCURRENCY", "8"))
+
+SOURCE_LABELS = {
+    "spotify": "Spotify",
+    "musicbrainz": "MusicBrainz",
+    "youtube": "YouTube",
+    "lastfm": "Last.fm",
+    "discogs": "Discogs",
+    "genius": "Genius",
+}
+
 
 class AsyncMetadataCollector:
     """Simple async metadata collector compatible with run.py DatabaseManager"""
 
-    def __init__(self, api_clients, db_manager):
+    def __init__(self, api_clients, db_manager, provider_cache_size=10_000, provider_cache_ttl_hours=24):
         self.api_clients = api_clients
         self.db_manager = db_manager
+        # Per-provider responses, so repeated ISRCs in a batch skip the network
+        self.provider_cache = TTLCache(provider_cache_size, provider_cache_ttl_hours * 3600)
 
     async def analyze_isrc_async(self, isrc, comprehensive=True, **kwargs):
         """Analyze ISRC async"""
+        # Normalize once up front; every provider and the cache get the same key,
+        # and malformed input fails here before any network I/O
+        isrc = self._normalize_isrc(isrc)
         if not self._validate_isrc(isrc):
             raise ValueError(f"Invalid ISRC: {isrc}")
 
         logger.info(f"🎵 Analyzing {isrc}")
+        started = time.perf_counter()
 
         # Check cache first
         cached = await self._get_cached_data_async(isrc)
@@ -44,7 +68,13 @@ class AsyncMetadataCollector:
         result = await self._aggregate_data_async(raw_data, isrc)
 
         # Store
-        await self._store_data_async(result)
+        history_row = {
+            "analysis_type": "comprehensive" if comprehensive else "basic",
+            "status": "success",
+            "confidence_score": result.get("confidence"),
+            "processing_time_ms": int((time.perf_counter() - started) * 1000),
+        }
+        await self._store_data_async(result, history_row)
 
         return result
 
@@ -55,27 +85,24 @@ class AsyncMetadataCollector:
         results = []
         errors = []
 
-        # Process in small batches
-        batch_size = 5
-        for i in range(0, len(isrc_list), batch_size):
-            batch = isrc_list[i : i + batch_size]
+        # Every ISRC is scheduled at once and the semaphore keeps BULK_CONCURRENCY
+        # running, so a slow lookup no longer holds up a whole batch
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
 
-            # Process batch
-            tasks = [self._analyze_single_safe(isrc, comprehensive) for isrc in batch]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def analyze(isrc):
+            async with semaphore:
+                return await self._analyze_single_safe(isrc, comprehensive)
 
-            # Collect results
-            for isrc, result in zip(batch, batch_results):
-                if isinstance(result, Exception):
-                    errors.append({"isrc": isrc, "error": str(result)})
-                elif result:
-                    results.append(result)
-                else:
-                    errors.append({"isrc": isrc, "error": "No data found"})
+        outcomes = await asyncio.gather(*(analyze(isrc) for isrc in isrc_list), return_exceptions=True)
 
-            # Small delay between batches
-            if i + batch_size < len(isrc_list):
-                await asyncio.sleep(1)
+        # Collect results in input order
+        for isrc, result in zip(isrc_list, outcomes):
+            if isinstance(result, Exception):
+                errors.append({"isrc": isrc, "error": str(result)})
+            elif result:
+                results.append(result)
+            else:
+                errors.append({"isrc": isrc, "error": "No data found"})
 
         return results, errors
 
@@ -87,14 +114,21 @@ class AsyncMetadataCollector:
             logger.error(f"❌ Failed to analyze {isrc}: {e}")
             return None
 
+    @staticmethod
+    def _normalize_isrc(isrc):
+        """Uppercase an ISRC and strip hyphens and whitespace"""
+        if not isrc:
+            return ""
+        cleaned = isrc.upper().replace("-", "").strip()
+        return cleaned if cleaned.isalnum() else _ISRC_STRIP_RE.sub("", cleaned)
+
     def _validate_isrc(self, isrc):
-        """Validate ISRC format"""
-        pattern = r"^[A-Z]{2}[A-Z0-9]{3}[0-9]{7}$"
-        return bool(re.match(pattern, isrc.upper()))
+        """Validate a normalized ISRC"""
+        return _ISRC_RE.fullmatch(isrc) is not None
 
     async def _get_cached_data_async(self, isrc):
         """Get cached data"""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self._get_cached_sync, isrc)
 
     def _get_cached_sync(self, isrc):
@@ -133,86 +167,89 @@ class AsyncMetadataCollector:
     async def _collect_data_async(self, isrc):
         """Collect data from APIs"""
         raw_data = {}
-        
+        clients = self.api_clients
+
+        # Primary sources are independent of each other, so query them concurrently
+        primary = {}
+        if clients and clients.spotify:
+            primary["spotify"] = self._cached("spotify", (isrc,), self._collect_spotify_async, isrc)
+        if clients and clients.musicbrainz:
+            primary["musicbrainz"] = self._cached("musicbrainz", (isrc,), self._collect_musicbrainz_async, isrc)
+        raw_data.update(await self._gather_sources(primary))
+
         # First, try to get basic info from primary sources
         primary_title = None
         primary_artist = None
         primary_album = None
 
-        # Collect from Spotify
-        if self.api_clients and self.api_clients.spotify:
-            try:
-                spotify_data = await self._collect_spotify_async(isrc)
-                if spotify_data:
-                    raw_data["spotify"] = spotify_data
-                    primary_title = spotify_data.get("title")
-                    primary_artist = spotify_data.get("artist")
-                    primary_album = spotify_data.get("album")
-            except Exception as e:
-                logger.error(f"Spotify collection failed: {e}")
-
-        # Collect from MusicBrainz
-        if self.api_clients and self.api_clients.musicbrainz:
-            try:
-                mb_data = await self._collect_musicbrainz_async(isrc)
-                if mb_data:
-                    raw_data["musicbrainz"] = mb_data
-                    if not primary_title:
-                        primary_title = mb_data.get("title")
-                        primary_artist = mb_data.get("artist")
-            except Exception as e:
-                logger.error(f"MusicBrainz collection failed: {e}")
+        if raw_data.get("spotify"):
+            primary_title = raw_data["spotify"].get("title")
+            primary_artist = raw_data["spotify"].get("artist")
+            primary_album = raw_data["spotify"].get("album")
+        if not primary_title and raw_data.get("musicbrainz"):
+            primary_title = raw_data["musicbrainz"].get("title")
+            primary_artist = raw_data["musicbrainz"].get("artist")
 
         # Now collect from secondary sources using the title/artist we found
         if primary_title and primary_artist:
-            
-            # Collect from YouTube
-            if self.api_clients and self.api_clients.youtube:
-                try:
-                    youtube_data = await self._collect_youtube_async(isrc, raw_data)
-                    if youtube_data:
-                        raw_data["youtube"] = youtube_data
-                except Exception as e:
-                    logger.error(f"YouTube collection failed: {e}")
-            
-            # Collect from Last.fm
-            if self.api_clients and self.api_clients.lastfm:
-                try:
-                    lastfm_data = await self._collect_lastfm_async(isrc, primary_title, primary_artist)
-                    if lastfm_data:
-                        raw_data["lastfm"] = lastfm_data
-                except Exception as e:
-                    logger.error(f"Last.fm collection failed: {e}")
-            
-            # Collect from Discogs
-            if self.api_clients and self.api_clients.discogs:
-                try:
-                    discogs_data = await self._collect_discogs_async(isrc, primary_title, primary_artist, primary_album)
-                    if discogs_data:
-                        raw_data["discogs"] = discogs_data
-                except Exception as e:
-                    logger.error(f"Discogs collection failed: {e}")
-            
-            # Collect from Genius (if available)
-            if self.api_clients and self.api_clients.genius:
-                try:
-                    genius_data = await self._collect_genius_async(primary_title, primary_artist)
-                    if genius_data:
-                        raw_data["genius"] = genius_data
-                except Exception as e:
-                    logger.error(f"Genius collection failed: {e}")
-
-        return raw_data
+            secondary = {}
+            if clients.youtube:
+                secondary["youtube"] = self._cached(
+                    "youtube", (isrc, primary_title, primary_artist), self._collect_youtube_async, isrc, raw_data
+                )
+            if clients.lastfm:
+                secondary["lastfm"] = self._cached(
+                    "lastfm", (primary_title, primary_artist), self._collect_lastfm_async, isrc, primary_title, primary_artist
+                )
+            if clients.discogs:
+                secondary["discogs"] = self._cached(
+                    "discogs", (primary_title, primary_artist, primary_album),
+                    self._collect_discogs_async, isrc, primary_title, primary_artist, primary_album
+                )
+            if clients.genius:
+                secondary["genius"] = self._cached(
+                    "genius", (primary_title, primary_artist), self._collect_genius_async, primary_title, primary_artist
+                )
+            raw_data.update(await self._gather_sources(secondary))
+
+        return {name: data for name, data in raw_data.items() if data}
+
+    async def _cached(self, provider, key, collector, *args):
+        """Return a cached provider response, collecting and caching it on a miss"""
+        cache_key = (provider, *key)
+        data = self.provider_cache.get(cache_key)
+        if data is not None:
+            return data
+        data = await collector(*args)
+        # Only successful lookups are cached; misses may be transient API errors
+        if data:
+            self.provider_cache.set(cache_key, data)
+        return data
+
+    def clear_provider_cache(self):
+        """Drop all cached provider responses"""
+        cleared = self.provider_cache.clear()
+        logger.info(f"🧹 Cleared {cleared} cached provider responses")
+        return cleared
+
+    async def _gather_sources(self, collectors):
+        """Run source collectors concurrently, logging failures per source"""
+        if not collectors:
+            return {}
+        results = await asyncio.gather(*collectors.values(), return_exceptions=True)
+        collected = {}
+        for name, result in zip(collectors, results):
+            if isinstance(result, Exception):
+                logger.error(f"{SOURCE_LABELS.get(name, name)} collection failed: {result}")
+            elif result:
+                collected[name] = result
+        return collected
 
     async def _collect_spotify_async(self, isrc):
         """Collect from Spotify"""
         try:
-            loop = asyncio.get_event_loop()
-
             # Search by ISRC
-            track = await loop.run_in_executor(
-                None, self.api_clients.spotify.search_by_isrc, isrc
-            )
+            track = await self.api_clients.spotify.search_by_isrc_async(isrc)
 
             if not track:
                 return None
@@ -221,10 +258,10 @@ class AsyncMetadataCollector:
             if not track_id:
                 return None
 
-            # Get audio features
-            audio_features = await loop.run_in_executor(
-                None, self.api_clients.spotify.get_audio_features, track_id
-            )
+            # Audio features cost an extra round trip and are opt-in
+            audio_features = None
+            if self.api_clients.config.get("ENABLE_SPOTIFY_AUDIO_FEATURES"):
+                audio_features = await self.api_clients.spotify.get_audio_features_async(track_id)
 
             return {
                 "source": "spotify",
@@ -246,11 +283,7 @@ class AsyncMetadataCollector:
     async def _collect_musicbrainz_async(self, isrc):
         """Collect from MusicBrainz"""
         try:
-            loop = asyncio.get_event_loop()
-
-            recording = await loop.run_in_executor(
-                None, self.api_clients.musicbrainz.search_recording_by_isrc, isrc
-            )
+            recording = await self.api_clients.musicbrainz.search_recording_by_isrc_async(isrc)
 
             if not recording:
                 return None
@@ -284,10 +317,7 @@ class AsyncMetadataCollector:
             if not title or not artist:
                 return None
             
-            loop = asyncio.get_event_loop()
-            video_data = await loop.run_in_executor(
-                None, self.api_clients.youtube.search_by_isrc, isrc, title, artist
-            )
+            video_data = await self.api_clients.youtube.search_by_isrc_async(isrc, title, artist)
             
             if not video_data:
                 return None
@@ -311,29 +341,17 @@ class AsyncMetadataCollector:
             if not title or not artist:
                 return None
             
-            loop = asyncio.get_event_loop()
+            lastfm = self.api_clients.lastfm
             
             # Get track info
-            track_info = await loop.run_in_executor(
-                None, 
-                self.api_clients.lastfm.get_track_info,
-                artist,
-                title
-            )
+            track_info = await lastfm.get_track_info_async(artist, title)
             
             if not track_info:
                 # Try searching instead
-                search_result = await loop.run_in_executor(
-                    None,
-                    self.api_clients.lastfm.search_track,
-                    title,
-                    artist
-                )
+                search_result = await lastfm.search_track_async(title, artist)
                 if search_result:
                     # Get full info for the found track
-                    track_info = await loop.run_in_executor(
-                        None,
-                        self.api_clients.lastfm.get_track_info,
+                    track_info = await lastfm.get_track_info_async(
                         search_result.get('artist', artist),
                         search_result.get('name', title)
                     )
@@ -342,22 +360,12 @@ class AsyncMetadataCollector:
                 return None
             
             # Get tags for genre information
-            tags = await loop.run_in_executor(
-                None,
-                self.api_clients.lastfm.get_track_tags,
-                artist,
-                title
-            )
+            tags = await lastfm.get_track_tags_async(artist, title)
             
             # Get album info if available
             album_info = None
             if track_info.get('album'):
-                album_info = await loop.run_in_executor(
-                    None,
-                    self.api_clients.lastfm.get_album_info,
-                    artist,
-                    track_info['album'].get('title', '')
-                )
+                album_info = await lastfm.get_album_info_async(artist, track_info['album'].get('title', ''))
             
             # Format the response
             return {
@@ -391,27 +399,15 @@ class AsyncMetadataCollector:
             if not title or not artist:
                 return None
             
-            loop = asyncio.get_event_loop()
+            discogs = self.api_clients.discogs
             
             # Search for the release
-            search_result = await loop.run_in_executor(
-                None,
-                self.api_clients.discogs.search_release,
-                title,
-                artist,
-                "release"
-            )
+            search_result = await discogs.search_release_async(title, artist, "release")
             
             if not search_result:
                 # Try searching with album name if available
                 if album:
-                    search_result = await loop.run_in_executor(
-                        None,
-                        self.api_clients.discogs.search_release,
-                        album,
-                        artist,
-                        "master"
-                    )
+                    search_result = await discogs.search_release_async(album, artist, "master")
             
             if not search_result:
                 return None
@@ -425,28 +421,20 @@ class AsyncMetadataCollector:
             elif search_result.get("type") == "master":
                 master_id = search_result.get("id")
                 # Get the main release for this master
-                master_info = await loop.run_in_executor(
-                    None,
-                    self.api_clients.discogs.get_master_release,
-                    master_id
-                )
+                master_info = await discogs.get_master_release_async(master_id)
                 if master_info and master_info.get("main_release"):
                     release_id = master_info["main_release"]
             
             # Get detailed release information
             release_data = None
             if release_id:
-                release_data = await loop.run_in_executor(
-                    None,
-                    self.api_clients.discogs.get_release,
-                    release_id
-                )
+                release_data = await discogs.get_release_async(release_id)
             
             if not release_data:
                 return None
             
             # Extract credits
-            credits = self.api_clients.discogs.extract_credits_from_release(release_data)
+            credits = discogs.extract_credits_from_release(release_data)
             
             # Find the specific track in the tracklist
             track_data = None
@@ -497,15 +485,8 @@ class AsyncMetadataCollector:
             if not self.api_clients.genius:
                 return None
                 
-            loop = asyncio.get_event_loop()
-            
             # Search for the song
-            song = await loop.run_in_executor(
-                None,
-                self.api_clients.genius.search_song,
-                title,
-                artist
-            )
+            song = await self.api_clients.genius.search_song_async(title, artist)
             
             if not song:
                 return None
@@ -513,11 +494,7 @@ class AsyncMetadataCollector:
             # Get detailed song info
             song_id = song.get("id")
             if song_id:
-                song_details = await loop.run_in_executor(
-                    None,
-                    self.api_clients.genius.get_song_details,
-                    song_id
-                )
+                song_details = await self.api_clients.genius.get_song_details_async(song_id)
                 
                 if song_details:
                     return {
@@ -730,26 +707,23 @@ class AsyncMetadataCollector:
 
         return result
 
-    async def _store_data_async(self, data):
+    async def _store_data_async(self, data, history_row=None):
         """Store data in database"""
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._store_data_sync, data)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._store_data_sync, data, history_row)
 
-    def _store_data_sync(self, data):
+    def _store_data_sync(self, data, history_row=None):
         """Sync store data using the simple database manager"""
         try:
-            # Save using the database manager's save_track_metadata method
-            self.db_manager.save_track_metadata(data)
+            # Track, lyrics, credits and history go out in one transaction
+            self.db_manager.save_full(
+                data["isrc"],
+                data,
+                lyrics_data=data.get("lyrics_data"),
+                credits=data.get("credits") or None,
+                history_row=history_row,
+            )
             logger.info(f"✅ Stored data for {data['isrc']}")
-            
-            # Save lyrics if available
-            if data.get("lyrics_data"):
-                self.db_manager.save_lyrics(data["isrc"], data["lyrics_data"])
-            
-            # Save credits if available  
-            if data.get("credits"):
-                self.db_manager.save_credits(data["isrc"], data["credits"])
                 
         except Exception as e:
             logger.error(f"❌ Storage error: {e}")
-            # Don't raise to prevent crashes, just log the error
\ No newline at end of file